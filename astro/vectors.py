@@ -16,6 +16,7 @@ Classes:
 
 
 import math
+import functools
 import numpy as np
 from orbits.astro.params import Earth
 from orbits.astro.afunc import orbital_radius, angular_momentum, node_vector, eccentricity_vector, \
@@ -23,6 +24,24 @@ from orbits.astro.afunc import orbital_radius, angular_momentum, node_vector, ec
 from orbits.astro.transf import peri_to_geo, peri_to_geo_i, peri_to_geo_e, topo_to_geo
 
 
+def _read_only_cache(matrix_function):
+    """ Caches a transformation matrix function; the cached matrices are shared, so they are made read only. """
+
+    @functools.lru_cache(maxsize=256)
+    def cached(*angles):
+        matrix = matrix_function(*angles)
+        matrix.setflags(write=False)
+        return matrix
+    return cached
+
+
+# The perifocal transformation matrices only depend on the angles, so repeated angles (maneuver presets, parameter
+# sweeps over the radius) reuse the same matrix.
+_peri_to_geo = _read_only_cache(peri_to_geo)
+_peri_to_geo_i = _read_only_cache(peri_to_geo_i)
+_peri_to_geo_e = _read_only_cache(peri_to_geo_e)
+
+
 class Elements:
     """ Finds the position and velocity vectors of the orbiting body from the given classical orbital elements
      (vectors are given in the Geocentric-Equatorial frame).
@@ -85,13 +104,13 @@ class Elements:
         """
 
         if self.eccentricity != 0 and math.sin(self.inclination) != 0:
-            self._chosen_matrix = peri_to_geo(self.inclination, self.longitude_of_ascending_node, self.periapsis_angle)
+            self._chosen_matrix = _peri_to_geo(self.inclination, self.longitude_of_ascending_node, self.periapsis_angle)
             return self._chosen_matrix.dot(vector)
         elif self.eccentricity != 0 and math.sin(self.inclination) == 0:
-            self._chosen_matrix = peri_to_geo_i(self.periapsis_angle)
+            self._chosen_matrix = _peri_to_geo_i(self.periapsis_angle)
             return self._chosen_matrix.dot(vector)
         elif self.eccentricity == 0 and math.sin(self.inclination) != 0:
-            self._chosen_matrix = peri_to_geo_e(self.inclination, self.longitude_of_ascending_node)
+            self._chosen_matrix = _peri_to_geo_e(self.inclination, self.longitude_of_ascending_node)
             return self._chosen_matrix.dot(vector)
         else:
             return vector
@@ -152,7 +171,7 @@ def elements_multiple(semi_latus_rectum, eccentricity, inclination, longitude_of
     or true longitude.
     :param gravitational_parameter: (float) Gravitational parameter (default is Earth.gravitational_parameter).
     :param degrees: (bool) True if all angles are given in degrees, False if radians (default is False).
-    :return: (list(lists)) The positions and velocities.
+    :return: (numpy arrays) The positions and velocities, one row for each orbit.
     """
 
     positions, velocities = [], []
@@ -163,7 +182,7 @@ def elements_multiple(semi_latus_rectum, eccentricity, inclination, longitude_of
                            gravitational_parameter=gravitational_parameter, degrees=degrees)
         positions.append(vectors.position)
         velocities.append(vectors.velocity)
-    return positions, velocities
+    return np.array(positions), np.array(velocities)
 
 
 class DetermineElements:
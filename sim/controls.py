@@ -1,14 +1,24 @@
 import math
-import copy
 import datetime
+from itertools import chain
 from vpython import button, winput, wtext, menu, keysdown, vector, label, checkbox
 from orbits.sim.sphere import Sphere
+from orbits.sim.rfunc import utc_now
 import orbits.sim.presets as presets
 import orbits.astro.params as params
 from orbits.astro.vectors import Elements, DopplerRadar, Radar
 from orbits.astro.maneuvers import Hohmann, BiElliptic, GeneralTransfer, SimplePlaneChange
 
 
+_DEG2RAD = math.pi/180
+_DELETE_KEYS = frozenset(('delete', 'backspace'))
+# winput.number is whatever the entry evaluates to in javascript, so strings, lists, dicts and booleans can get through
+_NUMERIC_TYPES = (int, float)
+# label widths that the body input labels are padded out to
+_ALIGN_WIDTH = len('Angular Velocity (\u00b0/s): ')
+_LOAN_WIDTH = len('Long. of Asc. Node (\u00b0): ')
+
+
 class Winput(winput):
     def __init__(self, width=98.95, **kwargs):
         kwargs['height'] = 23
@@ -34,17 +44,53 @@ class AttributeManager:
                                        params.Jupiter, params.Saturn, params.Uranus, params.Neptune]}
     preset_maneuvers_dict = {maneuver.classname: maneuver
                              for maneuver in [Hohmann, BiElliptic, GeneralTransfer, SimplePlaneChange]}
+    scenario_choices = ('Choose Scenario...', 'Create Scenario', 'Earth Satellites', 'Earth Satellites Perturbed',
+                        'Earth and Moon', 'Galilean Moons', *preset_maneuvers_dict)
+    body_choices = ('Choose Body...', 'Custom', *preset_bodies_dict)
+    maneuver_choices = ('No Maneuver', *preset_maneuvers_dict)
+    # scenario menu entries: (preset function, preset keyword arguments); 'start_offset' is the time between choosing
+    # the scenario and the start of its maneuver
+    scenario_presets = {'Earth Satellites': (presets.satellites, {'zoom': True, 'dt': 30, 'time_units': 'hr',
+                                                                  'rows': 2600}),
+                        'Earth Satellites Perturbed': (presets.satellites_perturbed,
+                                                       {'zoom': True, 'dt': 100, 'time_units': 'hr', 'rows': 2600,
+                                                        'body_semi_latus_rectum': 30000, 'body_eccentricity': 0.4}),
+                        'Hohmann Transfer': (presets.hohmann, {'start_offset': datetime.timedelta(seconds=10000),
+                                                               'inclination': 0}),
+                        'Bi-Elliptic Transfer': (presets.bi_elliptic,
+                                                 {'start_offset': datetime.timedelta(seconds=10000), 'inclination': 0}),
+                        'General Transfer': (presets.general, {'start_offset': datetime.timedelta(seconds=5000),
+                                                               'inclination': 0}),
+                        'Simple Plane Change': (presets.plane_change, {'start_offset': datetime.timedelta(seconds=5000)}),
+                        'Earth and Moon': (presets.earth_moon, {}),
+                        'Galilean Moons': (presets.galilean_moons, {})}
+    vector_blocks = {'Vectors': 'vectors_block', 'Elements': 'elements_block',
+                     'Doppler Radar': 'doppler_radar_block', 'Radar': 'radar_block'}
+    # maneuver menu entries: (caption block, maneuver class, whether the maneuver start time inputs are disabled)
+    maneuver_options = {'No Maneuver': (None, None, True),
+                        'Hohmann Transfer': ('hohmann_block', Hohmann, False),
+                        'Bi-Elliptic Transfer': ('bielliptic_block', BiElliptic, False),
+                        'General Transfer': ('general_block', GeneralTransfer, False),
+                        'Simple Plane Change': ('plane_change_block', SimplePlaneChange, False)}
     pixel_per_space = 197.9/18 # approximate amount of pixels per character on startup with current font settings
     convert_time_units = {'s': 1, 'min': 60, 'hr': 3600}
+    pause_text = {True: '<b>Pause</b>', False: '<b> Play  </b>'}
+    # shared by every button; vpython only reads it, the widgets never change their background in place
+    button_background = vector(0.7, 0.7, 0.7)
 
     attr_dict = {'running': True, 'scenario_running': False, 'previous_sphere': None, 'labelled_sphere': None,
-                 'loading_message': None, 'spheres': [], 'dt': 1.0, 'time_rate': 1, 'start_time': 'now',
+                 'loading_message': None, 'spheres': [], 'spheres_by_name': {}, 'sphere_indices': {}, 'dt': 1.0,
+                 'time_rate': 1, 'start_time': 'now',
                  '_year': None, '_month': None, '_day': None, '_hour': None, '_minute': None, '_second': None,
-                 'scene_height_sub': canvas_build_height_sub, 'axes': False, 'current_blocks': None, 'maneuver': None,
+                 'scene_height_sub': canvas_build_height_sub, 'axes': False, 'current_blocks': None,
+                 'active_block': None, 'maneuver': None,
                  'year_input': None, 'month_input': None, 'day_input': None, 'hour_input': None, 'minute_input': None,
                  'second_input': None, 'maneuver_year': None,  'maneuver_month': None, 'maneuver_day': None,
                  'maneuver_hour': None, 'maneuver_minute': None, 'maneuver_second': None, 'time_units': 's',
-                 'time_rate_seconds': 1, 'collisions': False, 'preset': None}
+                 'time_rate_seconds': 1, 'collisions': False, 'preset': None, 'custom_count': 0,
+                 'maneuver_time_pending': False}
+    maneuver_time_keys = ('maneuver_year', 'maneuver_month', 'maneuver_day', 'maneuver_hour', 'maneuver_minute',
+                          'maneuver_second')
 
     sphere_value_dict = {'position': [0.0, 0.0, 0.0], 'velocity': [0.0, 0.0, 0.0], 'mass': 10.0, 'radius': 100.0,
                          'rotation': 0.0, 'semi_latus_rectum': 0.0, 'eccentricity': 0.0, 'inclination': 0.0,
@@ -54,21 +100,36 @@ class AttributeManager:
                          'positions_3': [0.0, 0.0, 0.0], 'initial_radius': None, 'final_radius': None,
                          'transfer_apoapsis': None, 'transfer_eccentricity': None, 'inclination_change': None}
 
+    sphere_scalar_values = tuple((key, value) for key, value in sphere_value_dict.items() if not isinstance(value, list))
+    sphere_vector_keys = tuple(key for key, value in sphere_value_dict.items() if isinstance(value, list))
+
     attr_dict.update(sphere_value_dict)
+    default_scalar_values = tuple((key, value) for key, value in attr_dict.items()
+                                  if not isinstance(value, (list, dict)))
+    default_dict_keys = tuple(key for key, value in attr_dict.items() if isinstance(value, dict))
+
+    # Controls still gets a __dict__ for its widgets (LocationManager defines no slots), but the frequently read
+    # state attributes are stored in slots.
+    __slots__ = tuple(attr_dict)
 
     def __init__(self):
         self.default_values()
 
     def default_values(self):
-        for key, value in self.attr_dict.items():
-            if isinstance(value, list) and hasattr(self, key) and key == 'spheres':
-                getattr(self, key).clear()
-            elif isinstance(value, list) and hasattr(self, key) and key != 'spheres':
-                getattr(self, key)[0] = 0.0
-                getattr(self, key)[1] = 0.0
-                getattr(self, key)[2] = 0.0
-            else:
-                setattr(self, key, value)
+        # the spheres and vector lists are reset in place once they exist, since widgets and the simulation hold on
+        # to them; each instance gets its own containers so the class defaults are never mutated
+        if hasattr(self, 'spheres'):
+            self.spheres.clear()
+            for key in self.sphere_vector_keys:
+                getattr(self, key)[:] = (0.0, 0.0, 0.0)
+        else:
+            self.spheres = []
+            for key in self.sphere_vector_keys:
+                setattr(self, key, [0.0, 0.0, 0.0])
+        for key in self.default_dict_keys:
+            setattr(self, key, {})
+        for key, value in self.default_scalar_values:
+            setattr(self, key, value)
 
 
 class LocationManager:
@@ -177,6 +238,37 @@ class LocationManager:
                                                  ['create_body_button']],
                           'length': 111}
 
+    # Box Blocks (finished framed rows, keyed by block name and built on first use):
+    _box_block_cache = {}
+    box_chars = {'top_l': '\u256d', 'top_r': '\u256e', 'bot_l': '\u2570', 'bot_r': '\u256f',
+                 'vert': '\u2502', 'horiz': '\u2500'}
+
+    # Widget Spacing:
+    start_time_menu_spacing = {'starting_time_block': (' ', '')}
+
+    maneuver_menu_spacing = {'vectors_block': ' '*24, 'elements_block': ' '*41, 'doppler_radar_block': ' '*24,
+                             'radar_block': ' '*24, 'hohmann_block': ' '*84, 'bielliptic_block': ' '*84,
+                             'general_block': ' '*84, 'plane_change_block': ' '*84}
+
+    epoch_angle_spacing = {'elements_block': ' '*35, 'hohmann_block': ' '*78, 'bielliptic_block': ' '*78,
+                           'general_block': ' '*78, 'plane_change_block': ' '*78}
+
+    # (space before, space after) the widget; shared by the mass, radius, rotation, and name widgets
+    widget_spacing = {'vectors_block': ('', ' '*18), 'elements_block': (' '*2, ''), 'hohmann_block': (' '*2, ''),
+                      'bielliptic_block': (' '*2, ''), 'general_block': (' '*2, ''), 'plane_change_block': (' '*2, ''),
+                      'doppler_radar_block': ('', ' '*18), 'radar_block': ('', ' '*18)}
+
+    primary_spacing = {'vectors_block': ('', ' '*18), 'elements_block': (' '*2, ''), 'hohmann_block': (' '*2, ' '*43),
+                       'bielliptic_block': (' '*2, ''), 'general_block': (' '*2, ''),
+                       'plane_change_block': (' '*2, ' '*43), 'doppler_radar_block': ('', ' '*18),
+                       'radar_block': ('', ' '*18)}
+
+    initial_radius_spacing = {'hohmann_block': ('', ' '*11), 'bielliptic_block': (' '*3, ' '*8),
+                              'general_block': (' '*2, ' '*9), 'plane_change_block': (' '*3, ' '*8)}
+
+    final_radius_spacing = {'hohmann_block': (' '*2, ' '*11), 'bielliptic_block': (' '*5, ' '*8),
+                            'general_block': (' '*4, ' '*9)}
+
 
 class Controls(AttributeManager, LocationManager):
     """ Custom controls for interacting with VPython objects.
@@ -192,19 +284,30 @@ class Controls(AttributeManager, LocationManager):
         """
 
         self.scene = scene
+        self.vector_builders = {'Elements': self.build_from_elements, 'Doppler Radar': self.build_from_doppler_radar,
+                                'Radar': self.build_from_radar, 'Vectors': self.build_from_vectors}
+        self.title_row_funcs = tuple(getattr(self, func) for func in self.title_row)
+        self.caption_row_funcs = tuple(getattr(self, func) for func in self.caption_row)
+        self.separator = (None, '')
+        self.caption_layouts = {}
+        self.loading_label = None
         super().__init__()
         self.set_controls()
 
     def create_title_row(self):
         self.scene.title = ''
-        for func in self.title_row:
-            getattr(self, func)()
+        for func in self.title_row_funcs:
+            func()
 
     def create_caption_row(self):
         self.scene.caption = ''
-        for func in self.caption_row:
-            getattr(self, func)()
-        self.scene.append_to_caption('\n' + '\u2501'*(math.floor(self.scene.width/self.pixel_per_space)) + '\n\n')
+        for func in self.caption_row_funcs:
+            func()
+        # the separator only needs rebuilding when the canvas width changes
+        width = self.scene.width
+        if self.separator[0] != width:
+            self.separator = (width, '\n' + '\u2501'*(math.floor(width/self.pixel_per_space)) + '\n\n')
+        self.scene.append_to_caption(self.separator[1])
         if self.axes:
             self.show_axes.checked = True
         if self.collisions:
@@ -220,77 +323,101 @@ class Controls(AttributeManager, LocationManager):
         self.body_menu.disabled = self.pause.disabled = True
 
     def sphere_value_reset(self, full=False):
-        for key, value in self.sphere_value_dict.items():
-            if not full and key is not 'primary':
+        for key, value in self.sphere_scalar_values:
+            if full or key != 'primary':
                 setattr(self, key, value)
+        for key in self.sphere_vector_keys:
+            getattr(self, key)[:] = (0.0, 0.0, 0.0)
 
-    def create_caption_block(self, block):
-        chars = {'top_l': '\u256d', 'top_r': '\u256e', 'bot_l': '\u2570', 'bot_r': '\u256f',
-                 'vert': '\u2502', 'horiz': '\u2500'}
+    def add_sphere(self, sph):
+        """ Adds the Sphere to self.spheres and indexes it by its position and lowercase name. """
+
+        self.sphere_indices[sph] = len(self.spheres)
+        self.spheres.append(sph)
+        self.spheres_by_name[str(sph.name).lower()] = sph
 
+    def remove_sphere(self, sph):
+        """ Removes the Sphere from self.spheres and from the indices. The last Sphere is moved into its place, so
+        the order of self.spheres is not kept.
+        """
+
+        index = self.sphere_indices.pop(sph)
+        last = self.spheres.pop()
+        if last is not sph:
+            self.spheres[index] = last
+            self.sphere_indices[last] = index
+        name = str(sph.name).lower()
+        if self.spheres_by_name.get(name) is sph:
+            del self.spheres_by_name[name]
+
+    def create_caption_block(self, block):
         if isinstance(block, str):
-            self.current_blocks = [block]
-            block_values = [self.create_box_block(block)]
-        else:
-            self.current_blocks = [list(getattr(self, arg).keys())[0] for arg in block]
-            block_values = [self.create_box_block(arg) for arg in block if hasattr(self, arg)]
-
-        # gets the length of the longest row
-        i = 0
-        for row in block_values:
-            l = len(row)
-            if l > i:
-                i = l
-
-        # creates a new list with the elements in the proper order
-        blocks = []
-        for j in range(i):
-            temp = []
-            for k in range(len(block_values)):
-                try:
-                    temp.append(block_values[k][j])
-                except IndexError:
-                    pass
-            blocks.append(temp)
-
-        # removes some redundant list brackets
-        for l in range(len(blocks)):
-            for m in range(len(blocks[l])):
-                if m == 0:
-                    pass
-                else:
-                    blocks[l][0] = blocks[l][0] + blocks[l][m]
-            blocks[l] = blocks[l][0]
+            block = (block,)
 
-        # displays the contents of the list
+        if block not in self.caption_layouts:
+            self.caption_layouts[block] = self.compile_caption_block(block)
+        current_blocks, segments = self.caption_layouts[block]
+
+        self.current_blocks = list(current_blocks)
+        # the first block holds the widgets whose spacing depends on the layout
+        self.active_block = self.current_blocks[0] if self.current_blocks else None
+
+        for segment in segments:
+            if isinstance(segment, str):
+                self.scene.append_to_caption(segment)
+            else:
+                segment()
+
+    def compile_caption_block(self, block):
+        """ Lays out the given blocks side by side once, so that redrawing them only has to replay the result.
+
+        :param block: (tuple) The names of the LocationManager block dicts to display.
+        :return: (tuple) The block keys that are displayed and the caption segments: strings of box characters
+        and newlines, and the bound widget methods in between them.
+        """
+
+        current_blocks = []
+        block_values = []
+        for arg in block:
+            dictionary = getattr(self, arg, None)
+            if dictionary is None:
+                continue
+            current_blocks.append(next(iter(dictionary)))
+            block_values.append(self.create_box_block(dictionary))
+
+        # joins the j-th row of every block into one caption row, skipping blocks that have fewer rows
+        blocks = [list(chain.from_iterable(values[j] for values in block_values if j < len(values)))
+                  for j in range(max(map(len, block_values), default=0))]
+
+        # runs of box characters (including the row breaks) become one caption string
+        segments = []
+        text = ''
         for row in blocks:
-            for func in range(len(row)+1):
-                if func != len(row):
-                    if row[func] in chars.keys():
-                        self.scene.append_to_caption(chars[row[func]])
-                    else:
-                        getattr(self, row[func])()
+            for item in row:
+                char = self.box_chars.get(item)
+                if char is not None:
+                    text += char
                 else:
-                    self.scene.append_to_caption('\n')
+                    if text:
+                        segments.append(text)
+                        text = ''
+                    segments.append(getattr(self, item))
+            text += '\n'
+        if text:
+            segments.append(text)
+        return tuple(current_blocks), tuple(segments)
 
-    def create_box_block(self, block):
-        dictionary = getattr(self, block)
-        new_dictionary = copy.deepcopy(dictionary)
-        block_values = new_dictionary[block]
-        horiz_num = new_dictionary['length']
+    def create_box_block(self, dictionary):
+        block = next(iter(dictionary))
+        if block not in self._box_block_cache:
+            rows = dictionary[block]
+            horiz = ('horiz',)*dictionary['length']
+            # the first and last rows sit outside of the box, every row in between is wrapped with vertical borders
+            self._box_block_cache[block] = (tuple(rows[0]), ('top_l', *horiz, 'top_r'),
+                                            *(('vert', *row, 'vert') for row in rows[1:-1]),
+                                            ('bot_l', *horiz, 'bot_r'), tuple(rows[-1]))
 
-        horiz = ['horiz']*horiz_num
-        box_block = [['top_l', *horiz, 'top_r'],
-                     'vert',
-                     ['bot_l', *horiz, 'bot_r']]
-
-        block_values.insert(-1, box_block[2])
-        block_values.insert(1, box_block[0])
-        for i in range(len(block_values)):
-            if i != 0 and i != 1 and i != len(block_values)-1 and i != len(block_values)-2:
-                block_values[i].insert(0, box_block[1])
-                block_values[i].append(box_block[1])
-        return block_values
+        return [list(row) for row in self._box_block_cache[block]]
 
 
 
@@ -313,14 +440,11 @@ class Controls(AttributeManager, LocationManager):
     def pause_button_func(self, b):
         if self.scenario_running:
             self.running = not self.running
-            if self.running:
-                b.text = '<b>Pause</b>'
-            else:
-                b.text = '<b> Play  </b>'
+            b.text = self.pause_text[self.running]
 
     def pause_button(self):
-        self.pause = button(text='<b>Pause</b>', pos=self.scene.title_anchor, bind=self.pause_button_func,
-                            background=vector(0.7, 0.7, 0.7))
+        self.pause = button(text=self.pause_text[self.running], pos=self.scene.title_anchor, bind=self.pause_button_func,
+                            background=self.button_background)
 
     def reset_button_func(self, b):
         if self.spheres:
@@ -332,13 +456,13 @@ class Controls(AttributeManager, LocationManager):
 
     def reset_button(self):
         self.reset = button(text='<b>Reset</b>', pos=self.scene.title_anchor, bind=self.reset_button_func,
-                            background=vector(0.7, 0.7, 0.7))
+                            background=self.button_background)
 
     def camera_follow_func(self, w):
-        for sph in self.spheres:
-            if sph.name.lower() == w.text.lower():
-                self.scene.camera.follow(sph)
-                self.set_zoom(sph.radius, 3)
+        sph = self.spheres_by_name.get(str(w.text).lower())
+        if sph is not None:
+            self.scene.camera.follow(sph)
+            self.set_zoom(sph.radius, 3)
 
     def camera_follow_Winput(self):
         self.follow_text = wtext(text=' <b>Following: </b>', pos=self.scene.title_anchor)
@@ -346,9 +470,10 @@ class Controls(AttributeManager, LocationManager):
                                    type='string')
 
     def dt_Winput_func(self, w):
-        if isinstance(w.number, (int, float)):
+        number = w.number
+        if isinstance(number, _NUMERIC_TYPES) and not isinstance(number, bool):
             if self.dt < self.time_rate_seconds:
-                self.dt = w.text = w.number
+                self.dt = w.text = number
             else:
                 self.dt = w.text = self.time_rate_seconds
 
@@ -396,11 +521,15 @@ class Controls(AttributeManager, LocationManager):
                                           text='Collisions')
 
     def loading(self, state):
+        # the label is created once and then only shown and hidden; loading_message is only set while loading
         if state:
-            self.loading_message = label(text='Building Scenario', height=45, font='sans', box=False)
+            if self.loading_label is None:
+                self.loading_label = label(text='Building Scenario', height=45, font='sans', box=False)
+            else:
+                self.loading_label.visible = True
+            self.loading_message = self.loading_label
         else:
-            self.loading_message.visible = False
-            del self.loading_message
+            self.loading_label.visible = False
             self.loading_message = None
 
     def scenario_menu_func(self, m):
@@ -412,6 +541,8 @@ class Controls(AttributeManager, LocationManager):
             self.time_rate_seconds = self.time_rate*self.convert_time_units[self.time_units]
             self.dt_input.text = self.dt = dt
             self.spheres = list(func(**kwargs))
+            self.spheres_by_name = {str(sph.name).lower(): sph for sph in self.spheres}
+            self.sphere_indices = {sph: index for index, sph in enumerate(self.spheres)}
             self.primary = self.spheres[0]
             self.scene.camera.follow(self.primary)
             self.follow_input.text = self.primary.name
@@ -421,59 +552,27 @@ class Controls(AttributeManager, LocationManager):
             self.scenario_menu.disabled = True
             self.loading(False)
 
-        if m.selected == 'Choose Scenario...':
-            pass
-
-        elif m.selected == 'Create Scenario':
+        if m.selected == 'Create Scenario':
             self.body_menu.disabled = False
 
-        elif m.selected == 'Earth Satellites':
-            preset(presets.satellites, zoom=True, dt=30, time_units='hr', rows=2600, show_axes=self.axes)
-
-        elif m.selected == 'Earth Satellites Perturbed':
-            preset(presets.satellites_perturbed, zoom=True, dt=100, time_units='hr', rows=2600,
-                   body_semi_latus_rectum=30000, body_eccentricity=0.4, show_axes=self.axes)
-
-        elif m.selected == 'Hohmann Transfer':
-            preset(presets.hohmann, start_time=datetime.datetime.utcnow() + datetime.timedelta(seconds=10000),
-                   inclination=0, show_axes=self.axes)
-
-        elif m.selected == 'Bi-Elliptic Transfer':
-            preset(presets.bi_elliptic, start_time=datetime.datetime.utcnow() + datetime.timedelta(seconds=10000),
-                   inclination=0, show_axes=self.axes)
-
-        elif m.selected == 'General Transfer':
-            preset(presets.general, start_time=datetime.datetime.utcnow() + datetime.timedelta(seconds=5000),
-                   inclination=0, show_axes=self.axes)
-
-        elif m.selected == 'Simple Plane Change':
-            preset(presets.plane_change, start_time=datetime.datetime.utcnow() + datetime.timedelta(seconds=5000),
-                   show_axes=self.axes)
-
-        elif m.selected == 'Earth and Moon':
-            preset(presets.earth_moon, show_axes=self.axes)
-
-        elif m.selected == 'Galilean Moons':
-            preset(presets.galilean_moons, show_axes=self.axes)
+        elif m.selected in self.scenario_presets:
+            func, kwargs = self.scenario_presets[m.selected]
+            kwargs = dict(kwargs, show_axes=self.axes)
+            if 'start_offset' in kwargs:
+                kwargs['start_time'] = utc_now() + kwargs.pop('start_offset')
+            preset(func, **kwargs)
 
     def scenario_menu_dropdown(self):
-        c = ['Choose Scenario...', 'Create Scenario', 'Earth Satellites', 'Earth Satellites Perturbed',
-             'Earth and Moon', 'Galilean Moons', *list(self.preset_maneuvers_dict.keys())]
-        self.scenario_menu = menu(choices=c, bind=self.scenario_menu_func)
+        self.scenario_menu = menu(choices=self.scenario_choices, bind=self.scenario_menu_func)
 
     def start_time_menu_func(self, m):
-        choices = {'Present Time': True, 'Custom Time': False}
-        self.year_input.disabled = self.month_input.disabled = self.day_input.disabled = \
-            self.hour_input.disabled = self.minute_input.disabled = self.second_input.disabled = \
-            self.set_time.disabled = choices[m.selected]
+        disabled = m.selected == 'Present Time'
+        for widget in (self.year_input, self.month_input, self.day_input, self.hour_input, self.minute_input,
+                       self.second_input, self.set_time):
+            widget.disabled = disabled
 
     def start_time_menu_dropdown(self):
-        if self.current_blocks[0] == 'starting_time_block':
-            space_1 = ' '
-            space_2 = ''
-        else:
-            space_1 = ''
-            space_2 = ' '*63
+        space_1, space_2 = self.start_time_menu_spacing.get(self.current_blocks[0], ('', ' '*63))
 
         self.scene.append_to_caption(space_1)
         c = ['Present Time', 'Custom Time']
@@ -484,6 +583,9 @@ class Controls(AttributeManager, LocationManager):
         if isinstance(w.number, int):
             w.text = w.number
             setattr(self, w.attr, w.number)
+            if w.attr in self.maneuver_time_keys:
+                # create_body_func only builds the maneuver start time once every part of it has been given
+                self.maneuver_time_pending = None not in (getattr(self, key) for key in self.maneuver_time_keys)
 
     def date_Winputs(self):
         self.date_text = wtext(text='Date (UTC): ')
@@ -492,7 +594,8 @@ class Controls(AttributeManager, LocationManager):
         self.month_input = Winput(text='Month', attr='_month', bind=self.start_time_Winput_func)
         self.scene.append_to_caption('-')
         self.day_input = Winput(text='Day', attr='_day', bind=self.start_time_Winput_func)
-        self.year_input.disabled = self.month_input.disabled = self.day_input.disabled = True
+        for widget in (self.year_input, self.month_input, self.day_input):
+            widget.disabled = True
 
     def time_Winputs(self):
         self.time_text = wtext(text='Time (UTC): ')
@@ -501,13 +604,14 @@ class Controls(AttributeManager, LocationManager):
         self.minute_input = Winput(text='Minute', attr='_minute', bind=self.start_time_Winput_func)
         self.scene.append_to_caption(':')
         self.second_input = Winput(text='Second', attr='_second', bind=self.start_time_Winput_func)
-        self.hour_input.disabled = self.minute_input.disabled = self.second_input.disabled = True
+        for widget in (self.hour_input, self.minute_input, self.second_input):
+            widget.disabled = True
 
     def set_time_button_func(self):
-        if self.start_time_menu.selected == 'Custom Time' and self._year is not None and self._month is not None and \
-                        self._day is not None and self._hour is not None and self._minute is not None and self._second:
-            self.start_time = datetime.datetime(year=self._year, month=self._month, day=self._day, hour=self._hour,
-                                                minute=self._minute, second=self._second)
+        parts = (self._year, self._month, self._day, self._hour, self._minute, self._second)
+        # a second (or hour/minute) of 0 is a valid start time, so only missing parts are rejected
+        if self.start_time_menu.selected == 'Custom Time' and None not in parts:
+            self.start_time = datetime.datetime(*parts)
             self._year = self._month = self._day = self._hour = self._minute = self._second = None
             self.create_caption_row()
             self.body_menu.disabled = True
@@ -515,68 +619,54 @@ class Controls(AttributeManager, LocationManager):
     def set_time_button(self):
         self.scene.append_to_caption(' ')
         self.set_time = button(text='<b>Set Start Time</b>', bind=self.set_time_button_func,
-                               background=vector(0.7, 0.7, 0.7))
+                               background=self.button_background)
         self.set_time.disabled = True
 
+    def apply_body_preset(self, preset):
+        """ Fills the body values in from one of the params body classes. """
+
+        self.preset = preset
+        self.mass = preset.mass
+        self.radius = preset.radius
+        self.rotation = preset.angular_rotation
+        self.name = preset.classname
+        self.texture = preset.texture
+
     def body_menu_func(self, m):
-        if self.spheres:
-            if m.selected == 'Choose Body...':
-                self.create_caption_row()
-            elif m.selected == 'Custom':
-                self.sphere_value_reset()
-                self.create_caption(('vectors_block', 'starting_time_block'))
-                self.body_menu.selected = m.selected
-                self.vector_menu.selected = 'Vectors'
-                self.maneuver_menu.disabled = True
-                if self.scenario_running:
-                    self.scene_height_sub = self.canvas_build_height_sub
-            else:
-                self.sphere_value_reset()
-                self.preset = self.preset_bodies_dict[m.selected]
-                self.mass = self.preset.mass
-                self.radius = self.preset.radius
-                self.rotation = self.preset.angular_rotation
-                self.name = str(self.preset())
-                self.texture = self.preset.texture
-                self.body_menu.selected = m.selected
-                self.create_caption(('vectors_block', 'starting_time_block'))
-                self.maneuver_menu.disabled = True
-                self.vector_menu.selected = 'Vectors'
-                if self.scenario_running:
-                    self.scene_height_sub = self.canvas_build_height_sub
+        if m.selected == 'Choose Body...':
+            self.create_caption_row()
+
+        elif m.selected == 'Custom' or self.spheres:
+            # the body is described with the vector inputs and created with the Create Body button
+            self.sphere_value_reset()
+            if m.selected != 'Custom':
+                self.apply_body_preset(self.preset_bodies_dict[m.selected])
+            self.create_caption(('vectors_block', 'starting_time_block'))
+            self.body_menu.selected = m.selected
+            self.vector_menu.selected = 'Vectors'
+            self.maneuver_menu.disabled = True
+            if self.spheres and self.scenario_running:
+                self.scene_height_sub = self.canvas_build_height_sub
+
         else:
-            if m.selected == 'Choose Body...':
-                self.create_caption_row()
-            elif m.selected == 'Custom':
-                self.sphere_value_reset()
-                self.create_caption(('vectors_block', 'starting_time_block'))
-                self.body_menu.selected = m.selected
-                self.maneuver_menu.disabled = True
-                self.vector_menu.selected = 'Vectors'
-            else:
-                self.preset = self.preset_bodies_dict[m.selected]
-                self.mass = self.preset.mass
-                self.radius = self.preset.radius
-                self.rotation = self.preset.angular_rotation
-                self.name = str(self.preset())
-                self.texture = self.preset.texture
-                self.create_caption(('vectors_block', 'starting_time_block'))
-                self.vector_menu.selected = 'Vectors'
-                self.vector_menu.disabled = self.create_body.disabled = self.maneuver_menu.disabled = True
-                self.previous_sphere = self.primary = Sphere(pos=(0, 0, 0), vel=(0, 0, 0), preset=self.preset,
-                                                             show_axes=self.axes)
-                self.preset = None
-                self.spheres.append(self.primary)
-                if m.selected == 'Sun':
-                    self.scene.lights[0].visible = False
-                    self.primary.luminous = True
-                self.scene.camera.follow(self.primary)
-                self.follow_input.text = self.primary.name
-                m.selected = 'Choose Body...'
+            # the first preset body becomes the primary at the origin straight away
+            self.apply_body_preset(self.preset_bodies_dict[m.selected])
+            self.create_caption(('vectors_block', 'starting_time_block'))
+            self.vector_menu.selected = 'Vectors'
+            self.vector_menu.disabled = self.create_body.disabled = self.maneuver_menu.disabled = True
+            self.previous_sphere = self.primary = Sphere(pos=(0, 0, 0), vel=(0, 0, 0), preset=self.preset,
+                                                         show_axes=self.axes)
+            self.preset = None
+            self.add_sphere(self.primary)
+            if m.selected == 'Sun':
+                self.scene.lights[0].visible = False
+                self.primary.luminous = True
+            self.scene.camera.follow(self.primary)
+            self.follow_input.text = self.primary.name
+            m.selected = 'Choose Body...'
 
     def body_menu_dropdown(self):
-        c = ['Choose Body...', 'Custom', *list(self.preset_bodies_dict.keys())]
-        self.body_menu = menu(choices=c, bind=self.body_menu_func)
+        self.body_menu = menu(choices=self.body_choices, bind=self.body_menu_func)
 
     def run_scenario_button_func(self, b):
         if self.spheres and not self.loading_message:
@@ -596,14 +686,11 @@ class Controls(AttributeManager, LocationManager):
 
     def run_scenario_button(self):
         self.run_scenario = button(text='<b>Run Scenario</b>', bind=self.run_scenario_button_func,
-                                   background=vector(0.7, 0.7, 0.7), pos=self.scene.title_anchor)
+                                   background=self.button_background, pos=self.scene.title_anchor)
 
     def vector_menu_func(self, m):
-        blocks = {'Vectors': 'vectors_block', 'Elements': 'elements_block',
-                  'Doppler Radar': 'doppler_radar_block', 'Radar': 'radar_block'}
-
         # self.sphere_value_reset()
-        self.create_caption((blocks[m.selected], 'starting_time_block'))
+        self.create_caption((self.vector_blocks[m.selected], 'starting_time_block'))
         self.vector_menu.selected = m.selected
         if m.selected != 'Elements':
             self.maneuver_menu.disabled = True
@@ -614,168 +701,137 @@ class Controls(AttributeManager, LocationManager):
         self.vector_menu = menu(choices=c, bind=self.vector_menu_func)
 
     def maneuver_menu_func(self, m):
-        vectors = {'Elements': 'elements_block', 'Doppler Radar': 'doppler_radar_block', 'Radar': 'radar_block'}
-
-        maneuvers = {'No Maneuver': (None, None, True),
-                     'Hohmann Transfer': ('hohmann_block', Hohmann, False),
-                     'Bi-Elliptic Transfer': ('bielliptic_block', BiElliptic, False),
-                     'General Transfer': ('general_block', GeneralTransfer, False),
-                     'Simple Plane Change': ('plane_change_block', SimplePlaneChange, False)}
-
-        self.maneuver = maneuvers[m.selected][1]
-        boolean = maneuvers[m.selected][2]
+        block, self.maneuver, boolean = self.maneuver_options[m.selected]
         vect = self.vector_menu.selected
 
-        if maneuvers[m.selected][0] is not None:
-            self.create_caption((maneuvers[m.selected][0], 'starting_time_block'))
+        if block is not None:
+            self.create_caption((block, 'starting_time_block'))
         else:
-            self.create_caption((vectors[vect], 'starting_time_block'))
+            self.create_caption((self.vector_blocks[vect], 'starting_time_block'))
 
         self.vector_menu.selected = vect
         self.maneuver_menu.selected = m.selected
 
-        self.maneuver_year_input.disabled = self.maneuver_month_input.disabled = \
-            self.maneuver_day_input.disabled = self.maneuver_hour_input.disabled = \
-            self.maneuver_minute_input.disabled = self.maneuver_second_input.disabled = boolean
+        for widget in (*self.maneuver_date_widgets, *self.maneuver_time_widgets):
+            widget.disabled = boolean
 
-        self.semi_latus_rectum_input.disabled = self.eccentricity_input.disabled = \
-            self.periapsis_angle_input.disabled = not boolean
+        for widget in (self.semi_latus_rectum_input, self.eccentricity_input, self.periapsis_angle_input):
+            widget.disabled = not boolean
 
     def maneuver_menu_dropdown(self):
-        spacing = {'vectors_block': ' '*24, 'elements_block': ' '*41,'doppler_radar_block': ' '*24,
-                   'radar_block': ' '*24, 'hohmann_block': ' '*84, 'bielliptic_block': ' '*84,
-                   'general_block': ' '*84, 'plane_change_block': ' '*84}
-        c = ['No Maneuver', *list(self.preset_maneuvers_dict.keys())]
-        self.maneuver_menu = menu(choices=c, bind=self.maneuver_menu_func)
+        self.maneuver_menu = menu(choices=self.maneuver_choices, bind=self.maneuver_menu_func)
 
-        for key in spacing.keys():
-            if key in self.current_blocks:
-                self.scene.append_to_caption(spacing[key])
+        space = self.maneuver_menu_spacing.get(self.active_block)
+        if space:
+            self.scene.append_to_caption(space)
 
     def initial_radius_Winput_func(self, w):
         self.template_Winput_func(w)
         self.semi_latus_rectum_input.text = self.semi_latus_rectum = getattr(self, w.attr)
 
     def maneuver_initial_radius_Winput(self):
-        spacing = {'hohmann_block': ('', ' '*11), 'bielliptic_block': (' '*3, ' '*8),
-                   'general_block': (' '*2, ' '*9), 'plane_change_block': (' '*3, ' '*8)}
-
-        for key in spacing.keys():
-            if key in self.current_blocks:
-                space_1 = spacing[key][0]
-                space_2 = spacing[key][1]
+        space_1, space_2 = self.initial_radius_spacing[self.active_block]
 
-        self.scene.append_to_caption(' '*2)
-        self.maneuver_initial_radius_text = wtext(text='Initial Radius (km): ')
-        self.scene.append_to_caption(space_1)
+        self.maneuver_initial_radius_text = wtext(text='  Initial Radius (km): ' + space_1)
         self.maneuver_initial_radius_input = Winput(text='', bind=self.initial_radius_Winput_func,
                                                     attr='initial_radius')
         self.scene.append_to_caption(space_2)
 
     def maneuver_final_radius_Winput(self):
-        spacing = {'hohmann_block': (' '*2, ' '*11), 'bielliptic_block': (' '*5, ' '*8),
-                   'general_block': (' '*4, ' '*9)}
-
-        for key in spacing.keys():
-            if key in self.current_blocks:
-                space_1 = spacing[key][0]
-                space_2 = spacing[key][1]
+        space_1, space_2 = self.final_radius_spacing[self.active_block]
 
-        self.scene.append_to_caption(' '*2)
-        self.maneuver_final_radius_text = wtext(text='Final Radius (km): ')
-        self.scene.append_to_caption(space_1)
+        self.maneuver_final_radius_text = wtext(text='  Final Radius (km): ' + space_1)
         self.maneuver_final_radius_input = Winput(text='', bind=self.template_Winput_func, attr='final_radius')
         self.scene.append_to_caption(space_2)
 
     def maneuver_transfer_apoapsis_Winput(self):
-        self.scene.append_to_caption(' '*2)
-        self.maneuver_transfer_apoapsis_text = wtext(text='Transfer Apoapsis (km): ')
+        self.maneuver_transfer_apoapsis_text = wtext(text='  Transfer Apoapsis (km): ')
         self.maneuver_transfer_apoapsis_input = Winput(text='', bind=self.template_Winput_func,
                                                        attr='transfer_apoapsis')
         self.scene.append_to_caption(' '*8)
 
     def maneuver_transfer_eccentricity_Winput(self):
-        self.scene.append_to_caption(' '*2)
-        self.maneuver_transfer_eccentricity_text = wtext(text='Transfer Eccentricity: ')
+        self.maneuver_transfer_eccentricity_text = wtext(text='  Transfer Eccentricity: ')
         self.maneuver_transfer_eccentricity_input = Winput(text='', bind=self.template_Winput_func,
                                                            attr='transfer_eccentricity')
         self.scene.append_to_caption(' '*9)
 
     def maneuver_inclination_change_Winput(self):
-        self.scene.append_to_caption(' '*2)
-        self.maneuver_inclination_change_text = wtext(text='Inclination Change (\u00b0): ')
+        self.maneuver_inclination_change_text = wtext(text='  Inclination Change (\u00b0): ')
         self.maneuver_inclination_change_input = Winput(text='', bind=self.template_Winput_func,
                                                            attr='inclination_change')
         self.scene.append_to_caption(' '*8)
 
     def maneuver_date_Winputs(self):
-        self.scene.append_to_caption(' '*2)
-        self.maneuver_date_text = wtext(text='Date (UTC): ')
+        self.maneuver_date_text = wtext(text='  Date (UTC): ')
         self.maneuver_year_input = Winput(text='Year', bind=self.start_time_Winput_func, attr='maneuver_year')
         self.scene.append_to_caption('-')
         self.maneuver_month_input = Winput(text='Month', bind=self.start_time_Winput_func, attr='maneuver_month')
         self.scene.append_to_caption('-')
         self.maneuver_day_input = Winput(text='Day', bind=self.start_time_Winput_func, attr='maneuver_day')
-        self.maneuver_year_input.disabled = self.maneuver_month_input.disabled = \
-            self.maneuver_day_input.disabled = True
+        self.maneuver_date_widgets = (self.maneuver_year_input, self.maneuver_month_input, self.maneuver_day_input)
+        for widget in self.maneuver_date_widgets:
+            widget.disabled = True
 
     def maneuver_time_Winputs(self):
-        self.scene.append_to_caption(' '*2)
-        self.maneuver_time_text = wtext(text='Time (UTC): ')
+        self.maneuver_time_text = wtext(text='  Time (UTC): ')
         self.maneuver_hour_input = Winput(text='Hour', bind=self.start_time_Winput_func, attr='maneuver_hour')
         self.scene.append_to_caption(':')
         self.maneuver_minute_input = Winput(text='Minute', bind=self.start_time_Winput_func, attr='maneuver_minute')
         self.scene.append_to_caption(':')
         self.maneuver_second_input = Winput(text='Second', bind=self.start_time_Winput_func, attr='maneuver_second')
-        self.maneuver_hour_input.disabled = self.maneuver_minute_input.disabled = \
-            self.maneuver_second_input.disabled = True
+        self.maneuver_time_widgets = (self.maneuver_hour_input, self.maneuver_minute_input,
+                                      self.maneuver_second_input)
+        for widget in self.maneuver_time_widgets:
+            widget.disabled = True
 
     def vector_Winput_func(self, w):
-        if isinstance(w.number, (int, float)):
-            w.text = w.number
-            getattr(self, w.attr)[w.index] = w.number
+        number = w.number
+        if isinstance(number, _NUMERIC_TYPES) and not isinstance(number, bool):
+            w.text = number
+            w.target[w.index] = number
+
+    def triple_vector_Winput(self, text, attr, texts):
+        """ Builds the label and the three indexed Winputs that make up one vector input row.
+
+        :return: (tuple) The wtext label followed by the x, y and z Winputs.
+        """
+
+        # The vector lists are only ever reset in place, so the Winputs can hold on to them directly.
+        target = getattr(self, attr)
+        label_text = wtext(text=text + ' '*(_ALIGN_WIDTH-len(text)))
+        return (label_text, *(Winput(index=index, text=value, bind=self.vector_Winput_func, target=target)
+                              for index, value in enumerate(texts)))
 
     def position_Winput(self):
-        kwargs = {'bind': self.vector_Winput_func, 'attr': 'position'}
-        text = 'Position (km): '
-        self.position_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Angular Velocity (\u00b0/s): ')-len(text)))
-        self.position_x_input = Winput(index=0, text=str(self.position[0]), **kwargs)
-        self.position_y_input = Winput(index=1, text=str(self.position[1]), **kwargs)
-        self.position_z_input = Winput(index=2, text=str(self.position[2]), **kwargs)
+        self.position_text, self.position_x_input, self.position_y_input, self.position_z_input = \
+            self.triple_vector_Winput('Position (km): ', 'position', map(str, self.position))
 
     def velocity_Winput(self):
-        kwargs = {'bind': self.vector_Winput_func, 'attr': 'velocity'}
-        text = 'Velocity (km/s): '
-        self.velocity_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Angular Velocity (\u00b0/s): ')-len(text)))
-        self.velocity_x_input = Winput(index=0, text=str(self.velocity[0]), **kwargs)
-        self.velocity_y_input = Winput(index=1, text=str(self.velocity[1]), **kwargs)
-        self.velocity_z_input = Winput(index=2, text=str(self.velocity[2]), **kwargs)
+        self.velocity_text, self.velocity_x_input, self.velocity_y_input, self.velocity_z_input = \
+            self.triple_vector_Winput('Velocity (km/s): ', 'velocity', map(str, self.velocity))
 
     def template_Winput_func(self, w):
-        if isinstance(w.number, (int, float)):
-            w.text = w.number
-            setattr(self, w.attr, w.number)
+        number = w.number
+        if isinstance(number, _NUMERIC_TYPES) and not isinstance(number, bool):
+            w.text = number
+            setattr(self, w.attr, number)
 
     def semi_latus_rectum_Winput(self):
         text = 'Semilatus Rectum (km): '
-        self.semi_latus_rectum_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Long. of Asc. Node (\u00b0): ')-len(text)))
+        self.semi_latus_rectum_text = wtext(text=text + ' '*(_LOAN_WIDTH-len(text)))
         self.semi_latus_rectum_input = Winput(bind=self.template_Winput_func, text=str(self.semi_latus_rectum),
                                               attr='semi_latus_rectum')
 
     def eccentricity_Winput(self):
         text = 'Eccentricity: '
-        self.eccentricity_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Long. of Asc. Node (\u00b0): ')-len(text)))
+        self.eccentricity_text = wtext(text=text + ' '*(_LOAN_WIDTH-len(text)))
         self.eccentricity_input = Winput(bind=self.template_Winput_func, text=str(self.eccentricity),
                                          attr='eccentricity')
 
     def inclination_Winput(self):
         text = 'Inclination (\u00b0): '
-        self.inclination_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Long. of Asc. Node (\u00b0): ')-len(text)))
+        self.inclination_text = wtext(text=text + ' '*(_LOAN_WIDTH-len(text)))
         self.inclination_input = Winput(bind=self.template_Winput_func, text=str(self.inclination),
                                         attr='inclination')
 
@@ -785,75 +841,45 @@ class Controls(AttributeManager, LocationManager):
 
     def periapsis_angle_Winput(self):
         text = 'Periapsis Angle (\u00b0): '
-        self.periapsis_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Long. of Asc. Node (\u00b0): ')-len(text)))
+        self.periapsis_text = wtext(text=text + ' '*(_LOAN_WIDTH-len(text)))
         self.periapsis_angle_input = Winput(bind=self.template_Winput_func, text=str(self.periapsis_angle),
                                             attr='periapsis_angle')
 
     def epoch_angle_Winput(self):
-        spacing = {'elements_block': ' '*35, 'hohmann_block': ' '*78, 'bielliptic_block': ' '*78,
-                   'general_block': ' '*78, 'plane_change_block': ' '*78}
-
         text = 'Epoch Angle (\u00b0): '
-        self.epoch_angle_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Long. of Asc. Node (\u00b0): ')-len(text)))
+        self.epoch_angle_text = wtext(text=text + ' '*(_LOAN_WIDTH-len(text)))
         self.epoch_angle_input = Winput(bind=self.template_Winput_func, text=str(self.epoch_angle),
                                         attr='epoch_angle')
-        for key in spacing.keys():
-            if key in self.current_blocks:
-                self.scene.append_to_caption(spacing[key])
+        space = self.epoch_angle_spacing.get(self.active_block)
+        if space:
+            self.scene.append_to_caption(space)
 
     def mass_Winput(self):
-        spacing = {'vectors_block': ('', ' '*18), 'elements_block': (' '*2, ''), 'hohmann_block': (' ' * 2, ''),
-                   'bielliptic_block': (' '*2, ''), 'general_block': (' '*2, ''),  'plane_change_block': (' '*2, ''),
-                   'doppler_radar_block': ('', ' '*18), 'radar_block': ('', ' '*18)}
-
-        for key in spacing.keys():
-            if key in self.current_blocks:
-                space_1 = spacing[key][0]
-                space_2 = spacing[key][1]
+        space_1, space_2 = self.widget_spacing[self.active_block]
 
         text = 'Mass (kg): '
-        self.scene.append_to_caption(space_1)
-        self.mass_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Angular Velocity (\u00b0/s): ')-len(text)))
+        self.mass_text = wtext(text=space_1 + text + ' '*(_ALIGN_WIDTH-len(text)))
         self.mass_input = Winput(bind=self.template_Winput_func, text=str(self.mass), attr='mass')
         self.scene.append_to_caption(space_2)
 
     def radius_Winput(self):
-        spacing = {'vectors_block': ('', ' '*18),  'elements_block': (' '*2, ''), 'hohmann_block': (' '*2, ''),
-                   'bielliptic_block': (' '*2, ''), 'general_block': (' '*2, ''), 'plane_change_block': (' '*2,''),
-                   'doppler_radar_block': ('', ' '*18), 'radar_block': ('', ' '*18)}
-
-        for key in spacing.keys():
-            if key in self.current_blocks:
-                space_1 = spacing[key][0]
-                space_2 = spacing[key][1]
+        space_1, space_2 = self.widget_spacing[self.active_block]
 
         text = 'Radius (km): '
-        self.scene.append_to_caption(space_1)
-        self.radius_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Angular Velocity (\u00b0/s): ')-len(text)))
+        self.radius_text = wtext(text=space_1 + text + ' '*(_ALIGN_WIDTH-len(text)))
         self.radius_input = Winput(bind=self.template_Winput_func, text=str(self.radius), attr='radius')
         self.scene.append_to_caption(space_2)
 
     def rotation_Winput_func(self, w):
-        if isinstance(w.number, (int, float)):
-            w.text = w.number
-            setattr(self, w.attr, math.radians(w.number))
+        number = w.number
+        if isinstance(number, _NUMERIC_TYPES) and not isinstance(number, bool):
+            w.text = number
+            setattr(self, w.attr, number*_DEG2RAD)
 
     def rotation_Winput(self):
-        spacing = {'vectors_block': ('', ' '*18),  'elements_block': (' '*2, ''), 'hohmann_block': (' '*2, ''),
-                   'bielliptic_block': (' '*2, ''), 'general_block': (' '*2, ''), 'plane_change_block': (' '*2, ''),
-                   'doppler_radar_block': ('', ' '*18), 'radar_block': ('', ' '*18)}
-
-        for key in spacing.keys():
-            if key in self.current_blocks:
-                space_1 = spacing[key][0]
-                space_2 = spacing[key][1]
+        space_1, space_2 = self.widget_spacing[self.active_block]
 
-        self.scene.append_to_caption(space_1)
-        self.rotation_text = wtext(text='Angular Velocity (\u00b0/s): ')
+        self.rotation_text = wtext(text=space_1 + 'Angular Velocity (\u00b0/s): ')
         self.rotation_input = Winput(bind=self.rotation_Winput_func, text=str(self.rotation), attr='rotation')
         self.scene.append_to_caption(space_2)
 
@@ -862,44 +888,28 @@ class Controls(AttributeManager, LocationManager):
             self.name = w.text.lower()
 
     def name_Winput(self):
-        spacing = {'vectors_block': ('', ' '*18), 'elements_block': (' '*2, ''), 'hohmann_block': (' '*2, ''),
-                   'bielliptic_block': (' '*2, ''), 'general_block': (' '*2, ''), 'plane_change_block': (' '*2, ''),
-                   'doppler_radar_block': ('', ' '*18), 'radar_block': ('', ' '*18)}
-
-        for key in spacing.keys():
-            if key in self.current_blocks:
-                space_1 = spacing[key][0]
-                space_2 = spacing[key][1]
+        space_1, space_2 = self.widget_spacing[self.active_block]
 
         text = 'Name: '
-        self.scene.append_to_caption(space_1)
-        self.name_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Angular Velocity (\u00b0/s): ')-len(text)))
+        self.name_text = wtext(text=space_1 + text + ' '*(_ALIGN_WIDTH-len(text)))
         if not self.name:
-            self.name = f'Custom {len(self.spheres)}'
+            # A running count keeps default names unique even after spheres have been deleted.
+            self.custom_count += 1
+            self.name = f'Custom {self.custom_count}'
         self.name_input = Winput(bind=self.name_Winput_func, text=self.name, type='string')
         self.scene.append_to_caption(space_2)
 
     def primary_Winput_func(self, w):
         if isinstance(w.text, str):
-            for sph in self.spheres:
-                if w.text.lower() == sph.name:
-                    self.primary = sph
+            sph = self.spheres_by_name.get(w.text.lower())
+            if sph is not None:
+                self.primary = sph
 
     def primary_Winput(self):
-        spacing = {'vectors_block': ('', ' '*18), 'elements_block': (' '*2, ''), 'hohmann_block': (' '*2, ' '*43),
-                   'bielliptic_block': (' '*2, ''), 'general_block': (' '*2, ''), 'plane_change_block': (' '*2, ' '*43),
-                   'doppler_radar_block': ('', ' '*18), 'radar_block': ('', ' '*18)}
-
-        for key in spacing.keys():
-            if key in self.current_blocks:
-                space_1 = spacing[key][0]
-                space_2 = spacing[key][1]
+        space_1, space_2 = self.primary_spacing[self.active_block]
 
         text = 'Primary: '
-        self.scene.append_to_caption(space_1)
-        self.primary_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Angular Velocity (\u00b0/s): ')-len(text)))
+        self.primary_text = wtext(text=space_1 + text + ' '*(_ALIGN_WIDTH-len(text)))
         if self.primary:
             in_text = self.primary.name
         else:
@@ -908,58 +918,47 @@ class Controls(AttributeManager, LocationManager):
         self.scene.append_to_caption(space_2)
 
     def positions_Winput(self):
-        kwargs = {'bind': self.vector_Winput_func, 'attr': 'positions'}
-        text = 'Position (km, \u00b0, \u00b0): '
-        self.positions_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Angular Velocity (\u00b0/s): ')-len(text)))
-        self.range_input = Winput(index=0, text='Range', **kwargs)
-        self.azimuth_input = Winput(index=1, text='Azimuth', **kwargs)
-        self.altitude_input = Winput(index=2, text='Altitude', **kwargs)
+        self.positions_text, self.range_input, self.azimuth_input, self.altitude_input = \
+            self.triple_vector_Winput('Position (km, \u00b0, \u00b0): ', 'positions', ('Range', 'Azimuth', 'Altitude'))
 
     def speeds_Winput(self):
-        kwargs = {'bind': self.vector_Winput_func, 'attr': 'speeds'}
-        text = 'Speed (km/s, \u00b0/s, \u00b0/s): '
-        self.speeds_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Angular Velocity (\u00b0/s): ')-len(text)))
-        self.range_speed_input = Winput(index=0, text='Range', **kwargs)
-        self.azimuth_speed_input = Winput(index=1, text='Azimuth', **kwargs)
-        self.altitude_speed_input = Winput(index=2, text='Altitude', **kwargs)
+        self.speeds_text, self.range_speed_input, self.azimuth_speed_input, self.altitude_speed_input = \
+            self.triple_vector_Winput('Speed (km/s, \u00b0/s, \u00b0/s): ', 'speeds', ('Range', 'Azimuth', 'Altitude'))
 
     def locations_Winput(self):
-        kwargs = {'bind': self.vector_Winput_func, 'attr': 'locations'}
-        text = 'Location (km, \u00b0, \u00b0): '
-        self.locations_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Angular Velocity (\u00b0/s): ')-len(text)))
-        self.elevation_input = Winput(index=0, text='Elevation', **kwargs)
-        self.latitude_input = Winput(index=1, text='Latitude', **kwargs)
-        self.local_sidereal_time_input = Winput(index=2, text='LST', **kwargs)
+        self.locations_text, self.elevation_input, self.latitude_input, self.local_sidereal_time_input = \
+            self.triple_vector_Winput('Location (km, \u00b0, \u00b0): ', 'locations', ('Elevation', 'Latitude', 'LST'))
 
     def positions_1_Winput(self):
-        kwargs = {'bind': self.vector_Winput_func, 'attr': 'positions_1'}
-        text = 'Position 1 (km, \u00b0, \u00b0): '
-        self.positions_1_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Angular Velocity (\u00b0/s): ')-len(text)))
-        self.range_1_input = Winput(index=0, text='Range', **kwargs)
-        self.azimuth_1_input = Winput(index=1, text='Azimuth', **kwargs)
-        self.altitude_1_input = Winput(index=2, text='Altitude', **kwargs)
+        self.positions_1_text, self.range_1_input, self.azimuth_1_input, self.altitude_1_input = \
+            self.triple_vector_Winput('Position 1 (km, \u00b0, \u00b0): ', 'positions_1', ('Range', 'Azimuth', 'Altitude'))
 
     def positions_2_Winput(self):
-        kwargs = {'bind': self.vector_Winput_func, 'attr': 'positions_2'}
-        text = 'Position 2 (km, \u00b0, \u00b0): '
-        self.positions_2_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Angular Velocity (\u00b0/s): ')-len(text)))
-        self.range_2_input = Winput(index=0, text='Range', **kwargs)
-        self.azimuth_2_input = Winput(index=1, text='Azimuth', **kwargs)
-        self.altitude_2_input = Winput(index=2, text='Altitude', **kwargs)
+        self.positions_2_text, self.range_2_input, self.azimuth_2_input, self.altitude_2_input = \
+            self.triple_vector_Winput('Position 2 (km, \u00b0, \u00b0): ', 'positions_2', ('Range', 'Azimuth', 'Altitude'))
 
     def positions_3_Winput(self):
-        kwargs = {'bind': self.vector_Winput_func, 'attr': 'positions_3'}
-        text = 'Position 3 (km, \u00b0, \u00b0): '
-        self.positions_3_text = wtext(text=text)
-        self.scene.append_to_caption(' '*(len('Angular Velocity (\u00b0/s): ')-len(text)))
-        self.range_3_input = Winput(index=0, text='Range', **kwargs)
-        self.azimuth_3_input = Winput(index=1, text='Azimuth', **kwargs)
-        self.altitude_3_input = Winput(index=2, text='Altitude', **kwargs)
+        self.positions_3_text, self.range_3_input, self.azimuth_3_input, self.altitude_3_input = \
+            self.triple_vector_Winput('Position 3 (km, \u00b0, \u00b0): ', 'positions_3', ('Range', 'Azimuth', 'Altitude'))
+
+    def build_from_elements(self):
+        vectors = Elements(self.semi_latus_rectum, self.eccentricity, self.inclination, self.loan,
+                           self.periapsis_angle, self.epoch_angle, self.primary.grav_parameter, True)
+        return vectors.position, vectors.velocity
+
+    def build_from_doppler_radar(self):
+        vectors = DopplerRadar(positions=self.positions, speeds=self.speeds, station_location=self.locations,
+                               angular_velocity=self.primary.rotational_speed, degrees=True)
+        return vectors.geo_position, vectors.geo_velocity
+
+    def build_from_radar(self):
+        vectors = Radar(positions_one=self.positions_1, positions_two=self.positions_2,
+                        positions_three=self.positions_3, station_location=self.locations,
+                        gravitational_parameter=self.primary.grav_parameter, degrees=True)
+        return vectors.position, vectors.velocity
+
+    def build_from_vectors(self):
+        return self.position, self.velocity
 
     def create_body_func(self):
         kwargs = {'mass': self.mass, 'radius': self.radius, 'rotation_speed': self.rotation, 'texture': self.texture,
@@ -968,44 +967,17 @@ class Controls(AttributeManager, LocationManager):
                   'transfer_apoapsis': self.transfer_apoapsis, 'transfer_eccentricity': self.transfer_eccentricity,
                   'inclination_change': self.inclination_change}
 
-        if self.maneuver_year is not None and self.maneuver_month is not None and self.maneuver_day is not None and \
-                        self.maneuver_hour is not None and self.maneuver_minute is not None and \
-                        self.maneuver_second is not None:
-            kwargs['start_time'] = datetime.datetime(year=self.maneuver_year, month=self.maneuver_month,
-                                                     day=self.maneuver_day, hour=self.maneuver_hour,
-                                                     minute=self.maneuver_minute, second=self.maneuver_second)
-            self.maneuver_year = self.maneuver_month = self.maneuver_day = self.maneuver_hour = \
-                self.maneuver_minute = self.maneuver_second = None
-
-        if self.vector_menu.selected == 'Elements':
-            vectors = Elements(self.semi_latus_rectum, self.eccentricity, self.inclination, self.loan,
-                               self.periapsis_angle, self.epoch_angle, self.primary.grav_parameter, True)
-
-            self.previous_sphere = Sphere(pos=vectors.position, vel=vectors.velocity, **kwargs)
-            self.spheres.append(self.previous_sphere)
-            if self.previous_sphere is self.primary:
-                self.previous_sphere.toggle_axes()
-
-        elif self.vector_menu.selected == 'Doppler Radar':
-            vectors = DopplerRadar(positions=self.positions, speeds=self.speeds, station_location=self.locations,
-                                   angular_velocity=self.primary.rotational_speed, degrees=True)
-            self.previous_sphere = Sphere(pos=vectors.geo_position, vel=vectors.geo_velocity, **kwargs)
-            self.spheres.append(self.previous_sphere)
-            if self.previous_sphere is self.primary:
-                self.previous_sphere.toggle_axes()
-
-        elif self.vector_menu.selected == 'Radar':
-            vectors = Radar(positions_one=self.positions_1, positions_two=self.positions_2,
-                            positions_three=self.positions_3, station_location=self.locations,
-                            gravitational_parameter=self.primary.grav_parameter, degrees=True)
-            self.previous_sphere = Sphere(pos=vectors.position, vel=vectors.velocity, **kwargs)
-            self.spheres.append(self.previous_sphere)
-            if self.previous_sphere is self.primary:
-                self.previous_sphere.toggle_axes()
-
-        elif self.vector_menu.selected == 'Vectors':
-            self.previous_sphere = Sphere(pos=self.position, vel=self.velocity, **kwargs)
-            self.spheres.append(self.previous_sphere)
+        if self.maneuver_time_pending:
+            kwargs['start_time'] = datetime.datetime(*(getattr(self, key) for key in self.maneuver_time_keys))
+            for key in self.maneuver_time_keys:
+                setattr(self, key, None)
+            self.maneuver_time_pending = False
+
+        builder = self.vector_builders.get(self.vector_menu.selected)
+        if builder:
+            position, velocity = builder()
+            self.previous_sphere = Sphere(pos=position, vel=velocity, **kwargs)
+            self.add_sphere(self.previous_sphere)
             if self.previous_sphere is self.primary:
                 self.previous_sphere.toggle_axes()
 
@@ -1018,27 +990,27 @@ class Controls(AttributeManager, LocationManager):
     def create_body_button(self):
         self.scene.append_to_caption(' ')
         self.create_body = button(text='<b>Create Body</b>', bind=self.create_body_func,
-                                  background=vector(0.7, 0.7, 0.7))
+                                  background=self.button_background)
 
     def mouse_down(self):
-        keys = keysdown()
+        keys = set(keysdown())
         obj = self.scene.mouse.pick
 
         if isinstance(obj, Sphere):
-            if 'delete' in keys or 'backspace' in keys:
+            if keys & _DELETE_KEYS:
                 if obj.luminous and len(self.scene.lights) == 2:
                     self.scene.lights[0].visible = True
-                self.spheres.remove(obj)
+                self.remove_sphere(obj)
                 if obj is self.primary:
                     self.primary = None
                 obj.delete()
             else:
-                if isinstance(self.labelled_sphere, Sphere):
+                if self.labelled_sphere is not None:
                     self.labelled_sphere.labelled = False
                 self.labelled_sphere = obj
                 obj.labelled = True
         else:
-            if isinstance(self.labelled_sphere, Sphere):
+            if self.labelled_sphere is not None:
                 self.labelled_sphere.labelled = False
             self.labelled_sphere = None
 
@@ -0,0 +1,147 @@
+"""
+Array kernels used by the simulation loop; the Sphere values are gathered into numpy arrays (one row per Sphere) so
+that the work for every Sphere is done at once instead of with VPython vectors. If numba is installed, the
+acceleration kernel is compiled instead of using numpy broadcasting.
+
+Functions:
+    accelerations: The gravitational acceleration on every body due to all of the massive bodies.
+    collision_pairs: The pairs of bodies whose radii intersect.
+"""
+
+
+import itertools
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
+
+def _broadcast_accelerations(positions, massive_positions, massive_masses, gravity):
+    """ The numpy version of accelerations(); builds the full (N, M, 3) displacement array. """
+
+    displacements = massive_positions[None, :, :] - positions[:, None, :]
+    distances_squared = (displacements*displacements).sum(axis=-1)
+
+    # A body doesn't pull on itself (its distance to itself is 0).
+    with np.errstate(divide='ignore'):
+        inverse_cubes = np.where(distances_squared > 0.0, distances_squared**-1.5, 0.0)
+    return gravity*(displacements*(massive_masses[None, :]*inverse_cubes)[:, :, None]).sum(axis=1)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _compiled_accelerations(positions, masses, massive_indices, other_indices, gravity, out):
+        """ The numba version of accelerations(). The massive bodies pull on each other, so each massive pair is
+        only visited once (Newton's third law); the other bodies are split between threads. """
+
+        out[:, :] = 0.0
+        count = massive_indices.shape[0]
+        for a in range(count):
+            i = massive_indices[a]
+            for b in range(a+1, count):
+                j = massive_indices[b]
+                dx = positions[j, 0] - positions[i, 0]
+                dy = positions[j, 1] - positions[i, 1]
+                dz = positions[j, 2] - positions[i, 2]
+                r2 = dx*dx + dy*dy + dz*dz
+                if r2 > 0.0:
+                    inverse_cube = gravity*r2**-1.5
+                    out[i, 0] += masses[j]*inverse_cube*dx
+                    out[i, 1] += masses[j]*inverse_cube*dy
+                    out[i, 2] += masses[j]*inverse_cube*dz
+                    out[j, 0] -= masses[i]*inverse_cube*dx
+                    out[j, 1] -= masses[i]*inverse_cube*dy
+                    out[j, 2] -= masses[i]*inverse_cube*dz
+
+        for t in prange(other_indices.shape[0]):
+            i = other_indices[t]
+            ax = ay = az = 0.0
+            xi, yi, zi = positions[i, 0], positions[i, 1], positions[i, 2]
+            for b in range(count):
+                j = massive_indices[b]
+                dx = positions[j, 0] - xi
+                dy = positions[j, 1] - yi
+                dz = positions[j, 2] - zi
+                r2 = dx*dx + dy*dy + dz*dz
+                if r2 > 0.0:
+                    scale = masses[j]*r2**-1.5
+                    ax += dx*scale
+                    ay += dy*scale
+                    az += dz*scale
+            out[i, 0] = gravity*ax
+            out[i, 1] = gravity*ay
+            out[i, 2] = gravity*az
+else:
+    _compiled_accelerations = None
+
+
+def accelerations(positions, masses, massive, gravity):
+    """ The gravitational acceleration on every body due to all of the massive bodies, using Newton's Law of Universal
+    Gravitation.
+
+    :param positions: (numpy array) The (N, 3) positions of the bodies.
+    :param masses: (numpy array) The (N,) masses of the bodies.
+    :param massive: (numpy array) The (N,) bool mask of the bodies that pull on the other bodies.
+    :param gravity: (float) The gravitational constant.
+    :return: (numpy array) The (N, 3) accelerations.
+    """
+
+    if _compiled_accelerations is None:
+        return _broadcast_accelerations(positions, positions[massive], masses[massive], gravity)
+    out = np.empty_like(positions)
+    _compiled_accelerations(positions, masses, np.flatnonzero(massive), np.flatnonzero(~massive), gravity, out)
+    return out
+
+
+_NEIGHBOUR_CELLS = tuple(itertools.product((-1, 0, 1), repeat=3))
+
+# A body is left out of the collision grid if its radius is more than this many times the median radius.
+_LARGE_RADIUS_FACTOR = 10.0
+
+
+def collision_pairs(positions, radii):
+    """ The pairs of bodies whose radii intersect. The bodies are put into a uniform grid of cells that are as wide
+    as the largest small body, so each small body is only tested against the bodies in its own and the 26
+    neighbouring cells. Bodies that are much larger than the median body (a planet among satellites would make the
+    cells huge) are tested against every body instead.
+
+    :param positions: (numpy array) The (N, 3) positions of the bodies.
+    :param radii: (numpy array) The (N,) radii of the bodies.
+    :return: (list) The (i, j) index pairs (i < j) of the intersecting bodies, in order.
+    """
+
+    if len(radii) < 2:
+        return []
+
+    large = radii > _LARGE_RADIUS_FACTOR*np.median(radii)
+    small = np.flatnonzero(~large)
+    cell_size = 2*radii[small].max()
+
+    pairs = set()
+    for i in np.flatnonzero(large):
+        distances = np.sqrt(((positions - positions[i])**2).sum(axis=1))
+        for j in np.flatnonzero(radii + radii[i] > distances).tolist():
+            if j != i:
+                pairs.add((min(i, j), max(i, j)))
+
+    if cell_size > 0:
+        grid = {}
+        for index, cell in zip(small.tolist(), np.floor(positions[small]/cell_size).astype(np.int64).tolist()):
+            grid.setdefault(tuple(cell), []).append(index)
+        grid = {cell: np.array(members) for cell, members in grid.items()}
+
+        # Each cell's bodies are tested against all of the bodies in the neighbouring cells at once.
+        for (x, y, z), members in grid.items():
+            neighbours = [grid[cell] for cell in ((x+dx, y+dy, z+dz) for dx, dy, dz in _NEIGHBOUR_CELLS)
+                          if cell in grid]
+            others = np.concatenate(neighbours)
+            displacements = positions[others][None, :, :] - positions[members][:, None, :]
+            reach = radii[members][:, None] + radii[others][None, :]
+            hits = (reach*reach > (displacements*displacements).sum(axis=-1)) & \
+                (members[:, None] < others[None, :])
+            rows, columns = np.nonzero(hits)
+            pairs.update(zip(members[rows].tolist(), others[columns].tolist()))
+
+    return sorted((int(i), int(j)) for i, j in pairs)
@@ -1,4 +1,5 @@
 import math
+import functools
 import numpy as np
 from orbits.sim.sphere import Sphere
 from orbits.sim.rfunc import sat_data, random_element_angles
@@ -7,19 +8,22 @@ from orbits.astro.vectors import Elements, elements_multiple
 from orbits.astro.maneuvers import Hohmann, BiElliptic, GeneralTransfer, SimplePlaneChange
 
 
+_EARTH_MU = params.Earth.gravitational_parameter
+# The radius of the starting low Earth orbit shared by the coplanar transfer presets.
+_EARTH_LEO = params.Earth.radius+2000
+
+
 def satellites(rows=30, radius=65.0, real_radius=5, show_axes=False):
     """ Animates satellite orbits around Earth with given satellite data. """
 
-    row_indices = np.arange(rows)
-    data = sat_data(row_indices=row_indices)
+    data = sat_data(rows=rows)
     semi_latus_rectum, eccentricity, inclination, masses, names = data
     loan, pa, ea = random_element_angles(len(semi_latus_rectum))
     vectors = elements_multiple(semi_latus_rectum=semi_latus_rectum, eccentricity=eccentricity, inclination=inclination,
                                 longitude_of_ascending_node=loan, periapsis_angle=pa, epoch_angle=ea)
     spheres = [Sphere(preset=params.Earth, show_axes=show_axes)]
-    for p, v, m, n in zip(vectors[0], vectors[1], masses, names):
-        spheres.append(Sphere(pos=p, vel=v, mass=m, radius=radius, real_radius=real_radius, name=n, massive=False,
-                              primary=spheres[0], simple=True))
+    spheres.extend(Sphere.from_arrays(vectors[0], vectors[1], masses, names, radius=radius, real_radius=real_radius,
+                                      massive=False, primary=spheres[0], simple=True))
     return spheres
 
 
@@ -28,37 +32,35 @@ def satellites_perturbed(rows=30, radius=65.0, real_radius=5, perturbing_body=pa
     """ Animates satellite orbits around Earth with given satellite data along with perturbations
     added by another body. """
 
-    row_indices = np.arange(rows)
-    data = sat_data(row_indices=row_indices)
-    semi_latus_rectum = list(data[0]) + [body_semi_latus_rectum]
-    eccentricity = list(data[1]) + [body_eccentricity]
-    inclination = list(data[2]) + [perturbing_body.inclination]
-    masses = list(data[3])
-    names = list(data[4])
+    data = sat_data(rows=rows)
+    semi_latus_rectum = np.append(data.semi_latus_rectum, body_semi_latus_rectum)
+    eccentricity = np.append(data.eccentricity, body_eccentricity)
+    inclination = np.append(data.inclination, perturbing_body.inclination)
+    masses, names = data.mass, data.name
     loan, pa, ea = random_element_angles(len(semi_latus_rectum))
     positions, velocities = elements_multiple(semi_latus_rectum=semi_latus_rectum, eccentricity=eccentricity,
                                               inclination=inclination, longitude_of_ascending_node=loan,
                                               periapsis_angle=pa, epoch_angle=ea)
     spheres = [Sphere(preset=params.Earth, show_axes=show_axes)]
-    spheres.append(Sphere(pos=positions.pop(), vel=velocities.pop(), preset=params.Moon, primary=spheres[0],
+    spheres.append(Sphere(pos=positions[-1], vel=velocities[-1], preset=params.Moon, primary=spheres[0],
                           make_trail=True, retain=200, trail_color='red'))
-    for p, v, m, n in zip(positions, velocities, masses, names):
-        spheres.append(Sphere(pos=p, vel=v, mass=m, radius=radius, real_radius=real_radius, name=n, massive=False,
-                              primary=spheres[0], simple=True))
+    spheres.extend(Sphere.from_arrays(positions[:-1], velocities[:-1], masses, names,
+                                      radius=radius, real_radius=real_radius, massive=False, primary=spheres[0],
+                                      simple=True))
     return spheres
 
 
-def hohmann(initial_radius=params.Earth.radius+2000, final_radius=params.Earth.radius+10000, inclination=0.0,
+def hohmann(initial_radius=_EARTH_LEO, final_radius=params.Earth.radius+10000, inclination=0.0,
             longitude_of_ascending_node=0.0, epoch_angle=0.0, mass=10.0, sat_radius=100.0, start_time=10000.0,
             show_axes=False):
     """ Animates a hohmann transfer of a satellite around Earth.
 
     :param initial_radius: (float) The radius of the initial circular orbit (default is Earth.radius+2000).
     :param final_radius: (float) The radius of the final circular orbit (default is Earth.radius+20000).
-    :param inclination: (float) The inclination of the initial circular orbit in radians (default is 0.0).
-    :param longitude_of_ascending_node: (float) The longitude of ascending node of the circular orbit in radians;
+    :param inclination: (float) The inclination of the initial circular orbit in degrees (default is 0.0).
+    :param longitude_of_ascending_node: (float) The longitude of ascending node of the circular orbit in degrees;
     does nothing if inclination is 0 (default is 0.0).
-    :param epoch_angle: (float) The epoch angle of the circular orbit (default is 0.0).
+    :param epoch_angle: (float) The epoch angle of the circular orbit in degrees (default is 0.0).
     :param mass: (float) The mass of the satellite in kg (default is 10.0).
     :param sat_radius: (float) The radius of the satellite sphere (default is 100.0).
     :param start_time: (float) The amount of time that will pass within the simulation in seconds before the
@@ -67,16 +69,17 @@ def hohmann(initial_radius=params.Earth.radius+2000, final_radius=params.Earth.r
     """
 
     earth = Sphere(preset=params.Earth, show_axes=show_axes)
-    vectors = Elements(semi_latus_rectum=initial_radius, inclination=inclination,
-                       longitude_of_ascending_node=longitude_of_ascending_node, epoch_angle=epoch_angle, degrees=True)
+    vectors = Elements(semi_latus_rectum=initial_radius, inclination=math.radians(inclination),
+                       longitude_of_ascending_node=math.radians(longitude_of_ascending_node),
+                       epoch_angle=math.radians(epoch_angle))
     satellite = Sphere(pos=vectors.position, vel=vectors.velocity, mass=mass, radius=sat_radius, name='Satellite',
                        primary=earth, maneuver=Hohmann, make_trail=True, trail_limit=50,
                        initial_radius=initial_radius, final_radius=final_radius,
-                       gravitational_parameter=params.Earth.gravitational_parameter, start_time=start_time)
+                       gravitational_parameter=_EARTH_MU, start_time=start_time)
     return earth, satellite
 
 
-def bi_elliptic(initial_radius=params.Earth.radius+2000, final_radius=params.Earth.radius+7000,
+def bi_elliptic(initial_radius=_EARTH_LEO, final_radius=params.Earth.radius+7000,
                 transfer_apoapsis=params.Earth.radius+40000, inclination=0.0, longitude_of_ascending_node=0.0,
                 epoch_angle=0.0, mass=10.0, sat_radius=100.0, start_time=10000.0, show_axes=False):
     """ Animates a bi elliptic transfer of a satellite around Earth.
@@ -85,10 +88,10 @@ def bi_elliptic(initial_radius=params.Earth.radius+2000, final_radius=params.Ear
     :param final_radius: (float) The radius of the final circular orbit (default is Earth.radius+20000).
     :param transfer_apoapsis: (float) The distance from the center of the Earth to the apoapsis of the transfer ellipses
     (default is Earth.radius+40000).
-    :param inclination: (float) The inclination of the initial circular orbit in radians (default is 0.0).
-    :param longitude_of_ascending_node: (float) The longitude of ascending node of the circular orbit in radians;
+    :param inclination: (float) The inclination of the initial circular orbit in degrees (default is 0.0).
+    :param longitude_of_ascending_node: (float) The longitude of ascending node of the circular orbit in degrees;
     does nothing if inclination is 0 (default is 0.0).
-    :param epoch_angle: (float) The epoch angle of the circular orbit (default is 0.0).
+    :param epoch_angle: (float) The epoch angle of the circular orbit in degrees (default is 0.0).
     :param mass: (float) The mass of the satellite in kg (default is 10.0).
     :param sat_radius: (float) The radius of the satellite sphere (default is 100.0).
     :param start_time: (float) The amount of time that will pass within the simulation in seconds before the
@@ -97,16 +100,17 @@ def bi_elliptic(initial_radius=params.Earth.radius+2000, final_radius=params.Ear
     """
 
     earth = Sphere(preset=params.Earth, show_axes=show_axes)
-    vectors = Elements(semi_latus_rectum=initial_radius, inclination=inclination,
-                       longitude_of_ascending_node=longitude_of_ascending_node, epoch_angle=epoch_angle, degrees=True)
+    vectors = Elements(semi_latus_rectum=initial_radius, inclination=math.radians(inclination),
+                       longitude_of_ascending_node=math.radians(longitude_of_ascending_node),
+                       epoch_angle=math.radians(epoch_angle))
     satellite = Sphere(pos=vectors.position, vel=vectors.velocity, mass=mass, radius=sat_radius, name='Satellite',
                        primary=earth, maneuver=BiElliptic, make_trail=True, trail_limit=50,
                        initial_radius=initial_radius, final_radius=final_radius, transfer_apoapsis=transfer_apoapsis,
-                       gravitational_parameter=params.Earth.gravitational_parameter, start_time=start_time)
+                       gravitational_parameter=_EARTH_MU, start_time=start_time)
     return earth, satellite
 
 
-def general(initial_radius=params.Earth.radius+2000, final_radius=params.Earth.radius+20000, transfer_eccentricity=0.6,
+def general(initial_radius=_EARTH_LEO, final_radius=params.Earth.radius+20000, transfer_eccentricity=0.6,
             inclination=0.0, longitude_of_ascending_node=0.0, epoch_angle=0.0, mass=10.0, sat_radius=100.0,
             start_time=10000.0, show_axes=False):
     """ Animates a satellite performing a 'general' coplanar transfer around Earth.
@@ -114,10 +118,10 @@ def general(initial_radius=params.Earth.radius+2000, final_radius=params.Earth.r
     :param initial_radius: (float) The radius of the initial circular orbit (default is Earth.radius+2000).
     :param final_radius: (float) The radius of the final circular orbit (default is Earth.radius+20000).
     :param transfer_eccentricity: (float) The eccentricity of the transfer orbit (default is 0.6).
-    :param inclination: (float) The inclination of the initial circular orbit in radians (default is 0.0).
-    :param longitude_of_ascending_node: (float) The longitude of ascending node of the circular orbit in radians;
+    :param inclination: (float) The inclination of the initial circular orbit in degrees (default is 0.0).
+    :param longitude_of_ascending_node: (float) The longitude of ascending node of the circular orbit in degrees;
     does nothing if inclination is 0 (default is 0.0).
-    :param epoch_angle: (float) The epoch angle of the circular orbit (default is 0.0).
+    :param epoch_angle: (float) The epoch angle of the circular orbit in degrees (default is 0.0).
     :param mass: (float) The mass of the satellite in kg (default is 10.0).
     :param sat_radius: (float) The radius of the satellite sphere (default is 100).
     :param start_time: (float) The amount of time that will pass within the simulation in seconds before the
@@ -126,13 +130,14 @@ def general(initial_radius=params.Earth.radius+2000, final_radius=params.Earth.r
     """
 
     earth = Sphere(preset=params.Earth, show_axes=show_axes)
-    vectors = Elements(semi_latus_rectum=initial_radius, inclination=inclination,
-                       longitude_of_ascending_node=longitude_of_ascending_node, epoch_angle=epoch_angle, degrees=True)
+    vectors = Elements(semi_latus_rectum=initial_radius, inclination=math.radians(inclination),
+                       longitude_of_ascending_node=math.radians(longitude_of_ascending_node),
+                       epoch_angle=math.radians(epoch_angle))
     satellite = Sphere(pos=vectors.position, vel=vectors.velocity, mass=mass, radius=sat_radius, name='Satellite',
                        primary=earth, maneuver=GeneralTransfer, make_trail=True, trail_limit=50,
                        initial_radius=initial_radius, final_radius=final_radius, start_time=start_time,
                        transfer_eccentricity=transfer_eccentricity,
-                       gravitational_parameter=params.Earth.gravitational_parameter)
+                       gravitational_parameter=_EARTH_MU)
     return earth, satellite
 
 
@@ -142,11 +147,11 @@ def plane_change(radius=params.Earth.radius+3000, inclination_one=20, inclinatio
     """ Animates a satellite performing a simple plane change around Earth.
 
     :param radius: (float) The radius of the orbits (default is Earth.radius+2000).
-    :param inclination_one: (float) The inclination of the initial orbit (default is 0.0).
-    :param inclination_two: (float) The inclination of the final orbit (default is math.pi/3).
-    :param longitude_of_ascending_node: (float) The longitude of ascending node of the circular orbit in radians;
+    :param inclination_one: (float) The inclination of the initial orbit in degrees (default is 20).
+    :param inclination_two: (float) The inclination of the final orbit in degrees (default is 30).
+    :param longitude_of_ascending_node: (float) The longitude of ascending node of the circular orbit in degrees;
     does nothing if inclination is 0 (default is 0.0).
-    :param epoch_angle: (float) The epoch angle of the circular orbit (default is 0.0).
+    :param epoch_angle: (float) The epoch angle of the circular orbit in degrees (default is 0.0).
     :param mass: (float) The mass of the satellite in kg (default is 10.0).
     :param sat_radius: (float) The radius of the satellite sphere (default is 100.0).
     :param start_time: (float) The amount of time that will pass within the simulation in seconds before the
@@ -155,13 +160,15 @@ def plane_change(radius=params.Earth.radius+3000, inclination_one=20, inclinatio
     """
 
     earth = Sphere(preset=params.Earth, show_axes=show_axes)
-    vectors = Elements(semi_latus_rectum=radius, inclination=inclination_one,
-                       longitude_of_ascending_node=longitude_of_ascending_node, epoch_angle=epoch_angle, degrees=True)
-    inclination_change = math.radians(inclination_two - inclination_one)
+    incl_one = math.radians(inclination_one)
+    vectors = Elements(semi_latus_rectum=radius, inclination=incl_one,
+                       longitude_of_ascending_node=math.radians(longitude_of_ascending_node),
+                       epoch_angle=math.radians(epoch_angle))
+    inclination_change = math.radians(inclination_two) - incl_one
     satellite = Sphere(pos=vectors.position, vel=vectors.velocity, mass=mass, radius=sat_radius, name='Satellite',
                        primary=earth, maneuver=SimplePlaneChange, make_trail=True, trail_limit=50,
                        initial_radius=radius, start_time=start_time, inclination_change=inclination_change,
-                       gravitational_parameter=params.Earth.gravitational_parameter)
+                       gravitational_parameter=_EARTH_MU)
     return earth, satellite
 
 
@@ -178,20 +185,42 @@ def earth_moon(show_axes=False):
     return earth, moon
 
 
-def galilean_moons(show_axes=False):
-    """ Creates the Jupiter and Galilean moon system. """
+_GALILEAN_MOONS = (params.Io, params.Europa, params.Ganymede, params.Callisto)
+
+
+def _galilean_vectors_uncached(seed):
+    """ The positions and velocities of the Galilean moons; the angles are random unless a seed is given. """
+
+    s = [moon.semi_latus_rectum for moon in _GALILEAN_MOONS]
+    e = [moon.eccentricity for moon in _GALILEAN_MOONS]
+    i = [moon.inclination for moon in _GALILEAN_MOONS]
+    loan, pa, ea = random_element_angles(4, seed=seed)
+    return elements_multiple(semi_latus_rectum=s, eccentricity=e, inclination=i, longitude_of_ascending_node=loan,
+                             periapsis_angle=pa, epoch_angle=ea,
+                             gravitational_parameter=params.Jupiter.gravitational_parameter)
+
+
+@functools.lru_cache(maxsize=8)
+def _galilean_vectors(seed):
+    """ The positions and velocities of the Galilean moons for a given seed; the cached arrays are shared between
+    calls, so they are made read only. """
+
+    positions, velocities = _galilean_vectors_uncached(seed)
+    positions.setflags(write=False)
+    velocities.setflags(write=False)
+    return positions, velocities
+
+
+def galilean_moons(show_axes=False, seed=None):
+    """ Creates the Jupiter and Galilean moon system; a seed gives the same (cached) moon positions every time. """
 
     jupiter = Sphere(preset=params.Jupiter, show_axes=show_axes)
     spheres = [jupiter]
-    moons = [params.Io, params.Europa, params.Ganymede, params.Callisto]
-    s = [moon.semi_latus_rectum for moon in moons]
-    e = [moon.eccentricity for moon in moons]
-    i = [moon.inclination for moon in moons]
-    loan, pa, ea = random_element_angles(4)
-    positions, velocities = elements_multiple(semi_latus_rectum=s, eccentricity=e, inclination=i,
-                                              longitude_of_ascending_node=loan, periapsis_angle=pa, epoch_angle=ea,
-                                              gravitational_parameter=params.Jupiter.gravitational_parameter)
-    for moon, pos, vel in zip(moons, positions, velocities):
+    if seed is None:
+        positions, velocities = _galilean_vectors_uncached(None)
+    else:
+        positions, velocities = _galilean_vectors(seed)
+    for moon, pos, vel in zip(_GALILEAN_MOONS, positions, velocities):
         spheres.append(Sphere(pos=pos, vel=vel, preset=moon, primary=jupiter, make_trail=True, retain=500,
                               synchronous=True))
     return spheres
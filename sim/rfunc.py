@@ -4,119 +4,140 @@ Random miscellaneous functions.
 Attributes:
     __this_folder: (str) The directory name of the folder that contains this module.
     __satellite_file: (str) The path to the satellite data.
+    __rng: (numpy Generator) The random number generator used for the random element angles.
+    __cache_folder: (str) The user cache folder that the parquet copies of the satellite data are kept in.
+
+Classes:
+    SatData: The satellite columns returned by sat_data, as numpy arrays.
 
 Functions:
+    _load_sat_table: Reads the whole satellite excel file once, using a parquet copy of it when one is up to date.
     sat_data: Takes satellite orbit data from an excel file. Best used with r'UCS-Satellite-Database-8-1-2020.xls'.
-    decimal_length: Finds the amount of decimal places in the given float.
-    integer_length: Finds the amount if numbers that make up an integer.
-    round_to_place: Rounds some given number (int/float) to the given integer place.
     random_element_angles: Picks random values for longitude of ascending node, periapsis angle, and epoch angle
     in radians.
+    utc_now: The current UTC time as a naive datetime object.
 """
 
 
 import math
-import random
 import os
+import datetime
+import functools
+import hashlib
+from collections import namedtuple
 import numpy as np
 import pandas as pd
 from orbits.astro.params import Earth
 
 
 __this_folder = os.path.dirname(os.path.abspath(__file__))
-__satellite_file = os.path.join(__this_folder, 'data\\UCS-Satellite-Database-8-1-2020.xls')
+__satellite_file = os.path.join(__this_folder, 'data', 'UCS-Satellite-Database-8-1-2020.xls')
+__rng = np.random.default_rng()
+__cache_folder = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                              'orbits')
+
+
+SatData = namedtuple('SatData', ['semi_latus_rectum', 'eccentricity', 'inclination', 'mass', 'name'])
+SatData.__doc__ = """ The satellite columns returned by sat_data, as numpy arrays (inclination is in radians). """
+
+
+@functools.lru_cache(maxsize=4)
+def _load_sat_table(file):
+    """ Reads the whole satellite excel file once, using a parquet copy of it when one is up to date. The parquet copy
+    is written to the user cache folder (not the package folder, which may be read only) on the first read; if no
+    parquet engine is installed (or the copy can't be written) the excel file is simply read every time a new process
+    starts.
+
+    :param file: (str) The excel file that holds the orbit data.
+    :return: (pandas DataFrame) Every column of the excel file.
+    """
+
+    # the folder is part of the name so that excel files with the same name don't share a copy
+    path_hash = hashlib.sha1(os.path.abspath(file).encode()).hexdigest()[:12]
+    parquet = os.path.join(__cache_folder, f'{path_hash}-{os.path.basename(file)}.parquet')
+    if os.path.exists(parquet) and os.path.getmtime(parquet) >= os.path.getmtime(file):
+        try:
+            return pd.read_parquet(parquet)
+        except (ImportError, ValueError, OSError):
+            pass
+
+    try:
+        df = pd.read_excel(file, engine='calamine')
+    except (ImportError, ValueError):
+        # python-calamine isn't installed (or pandas is too old to know the engine)
+        df = pd.read_excel(file)
+    # pyarrow refuses columns of mixed types with ArrowTypeError, which is a TypeError.
+    try:
+        os.makedirs(__cache_folder, exist_ok=True)
+        df.to_parquet(parquet)
+    except (ImportError, OSError, ValueError, TypeError):
+        pass
+    return df
 
 
 def sat_data(file=__satellite_file, perigee='Perigee (km)', eccentricity='Eccentricity',
              inclination='Inclination (degrees)', mass='Dry Mass (kg.)', name='Current Official Name of Satellite',
-             row_indices=np.arange(30)):
+             row_indices=None, rows=30):
     """ Takes satellite orbit data from an excel file. Best used with r'UCS-Satellite-Database-8-1-2020.xls' which
     has data on 2787 satellites.
 
     :param file: (str) The excel file that holds the appropriate orbit data
-    (default is 'data\\UCS-Satellite-Database-8-1-2020.xls').
+    (default is 'data/UCS-Satellite-Database-8-1-2020.xls').
     :param perigee: (str) The perigee excel column header (default is 'Perigee (km)').
     :param eccentricity: (str) The eccentricity excel column header (default is 'Eccentricity').
     :param inclination: (str) The inclination excel column header (default is 'Inclination (degrees)').
     :param mass: (str) The mass excel column header (default is 'Dry Mass (kg.)').
     :param name: (str) The name column header (default is 'Current Official Name of Satellite').
-    :param row_indices: (list) Index values that indicate the desired excel rows (default is np.arange(30)).
-    :return: (list(lists)) The semi_latus_rectums, eccentricities, inclinations, masses, names.
+    :param row_indices: (list/slice) Index values that indicate the desired excel rows; if None, the first rows are
+    used (default is None).
+    :param rows: (int) The number of rows to use when row_indices is None (default is 30).
+    :return: (SatData) The semi_latus_rectums, eccentricities, inclinations, masses, names as numpy arrays.
     """
 
-    data = pd.read_excel(file, usecols=[perigee, eccentricity, inclination, mass, name])
-    df = pd.DataFrame(data).iloc[row_indices].fillna(1)
-    semi_latus_rectum = tuple((df[perigee] + Earth.radius)*(1 + df[eccentricity]))
-    e = tuple(df[eccentricity])
-    i = tuple(df[inclination]*math.pi/180)
-    m = tuple(df[mass])
-    n = tuple(df[name])
-    return semi_latus_rectum, e, i, m, n
-
-
-def decimal_length(num):
-    """ Finds the amount of decimal places in the given float.
-
-    :param num: (float) A floating point number.
-    :return: (int) The number of decimal places.
-    """
-
-    x = str(num).split('.')[-1]
-    if x == '0':
-        return 0
+    if row_indices is None:
+        selected = slice(0, rows)
+    elif isinstance(row_indices, slice):
+        selected = row_indices
+    elif len(row_indices) and np.array_equal(row_indices, np.arange(row_indices[0], row_indices[-1]+1)):
+        # consecutive rows can be sliced instead of fancy indexed
+        selected = slice(row_indices[0], row_indices[-1]+1)
     else:
-        return len(x)
+        selected = row_indices
+    df = _load_sat_table(file).iloc[selected][[perigee, eccentricity, inclination, mass, name]].fillna(1)
+    e = df[eccentricity].to_numpy()
+    semi_latus_rectum = (df[perigee].to_numpy() + Earth.radius)*(1.0 + e)
+    i = np.deg2rad(df[inclination].to_numpy())
+    m = df[mass].to_numpy()
+    n = df[name].to_numpy()
+    return SatData(semi_latus_rectum, e, i, m, n)
 
 
-def integer_length(num):
-    """ Finds the amount if numbers that make up an integer.
+def random_element_angles(num, step=0.05, seed=None):
+    """ Picks random values for longitude of ascending node, periapsis angle, and epoch angle in radians.
 
-    :param num: (int/float) An integer (ex. 10.0 will work as well).
-    :return: (int) The number of places in the integer.
+    :param num: (int) The desired length of the created arrays.
+    :param step: (float) The step size for the range of random angles that may be chosen from (default is 0.05).
+    :param seed: (int) If given, the angles are drawn from a generator with this seed so the same angles are
+    returned every time (default is None).
+    :return: (numpy arrays) Longitude of ascending node, periapsis angle, and epoch angle arrays.
     """
 
-    try:
-        x = str(num).split('.')[0]
-    except TypeError:
-        x = str(num)
-    if '-' in x:
-        x = x.replace('-', '')
-    return len(x)
-
+    # picks from the same grid as np.arange(0, 2*math.pi, step), all three angles in one draw
+    steps = math.ceil(2*math.pi/step)
+    rng = __rng if seed is None else np.random.default_rng(seed)
+    loan, pa, ea = rng.integers(0, steps, size=(3, num))*step
+    return loan, pa, ea
 
-def round_to_place(num, place):
-    """ Rounds some given number (int/float) to the given integer place. """
 
-    try:
-        a = str(num).split('.')[0]
-    except TypeError:
-        a = str(num)
-    len_a = len(a)
-    if 0 < place <= len_a:
-        b = a[(len_a-place):]
-        c = str(int(round(int(b)*10**-(len(b)-1), 0)))
-        d = a[:(len_a-place)]+c
-        for i in range(len(d), len_a):
-            d += '0'
-        return int(d)
-
-
-def random_element_angles(num, step=0.05):
-    """ Picks random values for longitude of ascending node, periapsis angle, and epoch angle in radians.
+def utc_now():
+    """ The current UTC time as a naive datetime object. Replaces the deprecated datetime.datetime.utcnow(); the
+    tzinfo is dropped so the result can still be compared with the naive datetimes used for maneuver start times.
 
-    :param num: (int) The desired length of the created lists.
-    :param step: (float) The step size for the range of random angles that may be chosen from (default is 0.05).
-    :return: (lists) Longitude of ascending node, periapsis angle, and epoch angle lists.
+    :return: (datetime object) The current UTC time.
     """
 
-    loan, pa, ea = [], [], []
-    angles = np.arange(0, 2*math.pi, step)
-    for i in range(num):
-        loan.append(random.choice(angles))
-        pa.append(random.choice(angles))
-        ea.append(random.choice(angles))
-    return loan, pa, ea
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
 
 
 def vector_to_np(vector):
-    return np.array([vector.x, vector.y, vector.z])
+    return np.array((vector.x, vector.y, vector.z), dtype=np.float64)
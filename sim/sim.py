@@ -1,15 +1,22 @@
+import math
 import datetime
+import numpy as np
 import pyautogui
-from vpython import canvas, rate, label, vector, mag, hat, cross
+from vpython import canvas, rate, label, vector, hat, cross
 from orbits.sim.controls import Controls
-from orbits.astro.transf import rodrigues_rotation
-from orbits.sim.rfunc import decimal_length, round_to_place, integer_length, vector_to_np
+from orbits.sim.kernels import accelerations, collision_pairs
+from orbits.sim.rfunc import utc_now
 from orbits.astro.maneuvers import Hohmann, BiElliptic, GeneralTransfer, SimplePlaneChange
 
 
 class Simulate:
     """ Simulates a system of orbiting spheres within VPython using Newton's Law of Universal Gravitation. """
 
+    # Tunable: the most loop iterations (frames) per second that rate() is asked for. When the time rate needs more
+    # steps per second than this, several steps are taken per frame and the spheres are only sent to VPython once per
+    # frame; raising it gives smoother trails at the cost of more VPython updates.
+    _frame_rate = 60
+
     def __init__(self):
         self._screen_width, self._screen_height = pyautogui.size()
         self._scene = canvas(width=self._screen_width-20)
@@ -22,72 +29,97 @@ class Simulate:
             self.__build_scenario()
             self.__simulate_scenario()
 
-    def __universal_gravitation(self, sphere_one, sphere_two):
-        """ Uses Newton's Law of Universal Gravitation to find the force of gravity on
-        the first sphere due to the second sphere.
+    @staticmethod
+    def __sphere_arrays(spheres):
+        """ The positions, velocities, masses, and massive flags of the spheres as numpy arrays (one row per sphere).
+
+        :param spheres: (list) The spheres.
+        :return: (tuple(numpy arrays)) The positions, velocities, masses, and massive flags.
+        """
+
+        positions = np.array([(sph.pos.x, sph.pos.y, sph.pos.z) for sph in spheres], dtype=np.float64)
+        velocities = np.array([(sph.vel.x, sph.vel.y, sph.vel.z) for sph in spheres], dtype=np.float64)
+        masses = np.array([sph.mass for sph in spheres], dtype=np.float64)
+        massive = np.array([sph.massive for sph in spheres], dtype=bool)
+        return positions.reshape(-1, 3), velocities.reshape(-1, 3), masses, massive
+
+    def __accelerations_current(self, spheres):
+        """ True if the cached accelerations from the last step belong to the given spheres (in the same order). """
+
+        cached = self._acceleration_spheres
+        return cached is not None and len(cached) == len(spheres) and \
+            all(sph1 is sph2 for sph1, sph2 in zip(cached, spheres))
+
+    def __schedule_impulses(self):
+        """ Orders the impulses of every sphere by the number of seconds after the start time that they happen. """
+
+        impulses = [((time - self._start_time).total_seconds(), sph, index)
+                    for sph in self._spheres if sph.impulses for index, time in enumerate(sph.times)
+                    if time >= self._start_time]
+        self._impulses = sorted(impulses, key=lambda impulse: impulse[0])
+        self._next_impulse = 0
+
+    def __steps_to_impulse(self, elapsed):
+        """ The number of time steps until the next impulse is due, or None if there are no impulses left.
+
+        :param elapsed: (float) The number of seconds since the start time.
+        :return: (int) The number of steps (at least 1).
+        """
+
+        if self._next_impulse == len(self._impulses) or self._dt <= 0:
+            return None
+        seconds = self._impulses[self._next_impulse][0]
+        return max(1, math.ceil((seconds - 0.5*self._dt - elapsed)/self._dt))
 
-        :param sphere_one: (Sphere) VPython sphere for first sphere.
-        :param sphere_two: (Sphere) VPython sphere for second sphere.
-        :return: (VPython vector) Force vector due to gravity on sphere_one from sphere_two.
+    def __apply_impulses(self, elapsed):
+        """ Applies every impulse that is due by the given time (to the nearest time step). To be used in
+        __update_spheres().
+
+        :param elapsed: (float) The number of seconds since the start time.
         """
 
-        position_vector = sphere_one.pos - sphere_two.pos
-        return -self._gravity*sphere_one.mass*sphere_two.mass*position_vector/mag(position_vector)**3
+        due = elapsed + 0.5*abs(self._dt)
+        while self._next_impulse < len(self._impulses) and self._impulses[self._next_impulse][0] <= due:
+            _, sphere, index = self._impulses[self._next_impulse]
+            self._next_impulse += 1
+            if sphere in self._controls.sphere_indices:
+                self.__apply_impulse(sphere, index)
 
-    def __update_forces(self):
-        """ A list of the total gravitational force at one point in time on one sphere due to all
-        other spheres (if they are considered 'massive'), for each sphere.
+    def __apply_impulse(self, sphere, index):
+        """ Applies one impulse to the desired sphere. To be used in __apply_impulses().
 
-        :return: (list) The total gravitational force on each sphere.
+        :param sphere: (Sphere) The sphere that the impulse is applied to.
+        :param index: (int) The index of the impulse in sphere.times.
         """
 
-        def f(sph1):
-            force = vector(0, 0, 0)
-            for sph2 in self._massives:
-                if sph1 is not sph2:
-                    force += self.__universal_gravitation(sph1, sph2)
-            return force
-
-        return [f(sph) for sph in self._spheres]
-
-    def __apply_impulse(self, sphere):
-        """ Applies an impulse to the desired sphere. To be used in __update_spheres(). """
-
-        for index, time in enumerate(sphere.times):
-            seconds1 = (self._time - self._start_time).total_seconds()
-            seconds2 = (time - self._start_time).total_seconds()
-            if self._dt < 0:
-                round(seconds2, decimal_length(self._dt))
-            elif self._dt > 0:
-                # A value of 10.1 would be rounded to the nearest 10's value (ignores the decimal places).
-                seconds2 = round_to_place(seconds2, integer_length(self._dt) + 1)
-
-            if seconds1 == seconds2:
-                if isinstance(sphere.impulses[0], tuple):
-                    delta_v = sphere.impulses[index][1]
-                    burn_angle = sphere.impulses[index][2]
-                else:
-                    delta_v = sphere.impulses[1]
-                    burn_angle = sphere.impulses[2]
-
-                if sphere.maneuver is Hohmann or sphere.maneuver is BiElliptic:
-                    sphere.vel += delta_v*hat(sphere.vel) + sphere.primary.vel
-                elif sphere.maneuver is GeneralTransfer:
-                    axis = vector_to_np(hat(cross(sphere._position, sphere._velocity)))
-                    sphere.vel += vector(*rodrigues_rotation(axis, burn_angle).dot(vector_to_np(delta_v*hat(sphere.vel)))) + sphere.primary.vel
-                elif sphere.maneuver is SimplePlaneChange:
-                    axis = vector_to_np(hat(sphere._position))
-                    sphere.vel += vector(*rodrigues_rotation(axis, burn_angle).dot(vector_to_np(delta_v*hat(sphere.vel)))) + sphere.primary.vel
-                else:
-                    #  If the user gives their own impulse instructions without a known maneuver title.
-                    pass
-
-    def __check_collisions(self, sph1):
+        if isinstance(sphere.impulses[0], tuple):
+            delta_v = sphere.impulses[index][1]
+            burn_angle = sphere.impulses[index][2]
+        else:
+            delta_v = sphere.impulses[1]
+            burn_angle = sphere.impulses[2]
+
+        if sphere.maneuver is Hohmann or sphere.maneuver is BiElliptic:
+            sphere.vel += delta_v*hat(sphere.vel) + sphere.primary.vel
+        elif sphere.maneuver is GeneralTransfer:
+            # vector.rotate() is the same Rodrigues rotation, without going through numpy arrays.
+            axis = cross(sphere._position, sphere._velocity)
+            sphere.vel += (delta_v*hat(sphere.vel)).rotate(angle=burn_angle, axis=axis) + sphere.primary.vel
+        elif sphere.maneuver is SimplePlaneChange:
+            axis = sphere._position
+            sphere.vel += (delta_v*hat(sphere.vel)).rotate(angle=burn_angle, axis=axis) + sphere.primary.vel
+        else:
+            #  If the user gives their own impulse instructions without a known maneuver title.
+            pass
+
+    def __check_collisions(self, spheres, pairs):
         """
-        Checks if the radii of any of the spheres intersect. If they do, applies a perfectly inelastic collision.
-        The sphere with the greater mass, survives. To be used in __update_spheres().
+        Applies a perfectly inelastic collision to each pair of spheres whose radii intersect.
+        The sphere with the greater mass, survives. The spheres that need to be removed from self._spheres are added
+        to self._collided. To be used in __update_spheres().
 
-        :return: (list) A list of Spheres that need to be removed from self._spheres due to collisions.
+        :param spheres: (list) The spheres that the pair indices refer to.
+        :param pairs: (list) The (i, j) index pairs of the intersecting spheres, from collision_pairs().
         """
 
         def f(winner, loser):
@@ -95,51 +127,80 @@ class Simulate:
             winner.mass += loser.mass
             self._collided.add(loser)
             loser.delete()
-            if loser == self._controls.labelled_sphere:
-                self._controls.labelled_sphere = False
-
-        for sph2 in self._spheres:
-            self._collisions = self._controls.collisions
-            if self._collisions and self._controls.running:
-                if (sph1 is not sph2) and (sph2 not in self._collided) and (sph1.real_radius + sph2.real_radius > mag(sph1.pos - sph2.pos)):
-                    if sph1.mass > sph2.mass:
-                        f(sph1, sph2)
-                    elif sph1.mass < sph2.mass:
-                        f(sph2, sph1)
-                    else:
-                        self._collided.add(sph1)
-                        self._collided.add(sph2)
-                        if sph1 == self._controls.labelled_sphere or sph2 == self._controls.labelled_sphere:
-                            self._controls.labelled_sphere = False
-                        sph1.delete()
-                        sph2.delete()
-            elif not self._collisions:
-                break
-            elif not self._controls.running:
-                while not self._controls.running:
-                    pass
-
-    def __update_spheres(self):
-        """ Updates the sphere values. """
+            if loser is self._controls.labelled_sphere:
+                self._controls.labelled_sphere = None
+
+        for i, j in pairs:
+            sph1, sph2 = spheres[i], spheres[j]
+            if sph1 in self._collided or sph2 in self._collided or \
+                    sph1 not in self._controls.sphere_indices or sph2 not in self._controls.sphere_indices:
+                continue
+            if sph1.mass > sph2.mass:
+                f(sph1, sph2)
+            elif sph1.mass < sph2.mass:
+                f(sph2, sph1)
+            else:
+                self._collided.add(sph1)
+                self._collided.add(sph2)
+                if sph1 is self._controls.labelled_sphere or sph2 is self._controls.labelled_sphere:
+                    self._controls.labelled_sphere = None
+                sph1.delete()
+                sph2.delete()
+
+    def __update_spheres(self, steps):
+        """ Updates the sphere values with kick-drift-kick leapfrog steps (velocity Verlet); the accelerations at
+        the end of a step are reused at the start of the next one, so there is one force evaluation per step.
+
+        :param steps: (int) The number of time steps to take before the spheres are updated in VPython.
+        :return: (int) The number of time steps taken; fewer than steps if spheres collided.
+        """
 
         self._collided = set()
-        for sph, forces in zip(self._spheres, self.__update_forces()):
-            sph.vel += forces*self._dt/sph.mass
-
-            if sph.impulses:
-                self.__apply_impulse(sph)
-
-            if self._collisions and sph not in self._collided:
-                self.__check_collisions(sph)
-
-            sph.pos += sph.vel*self._dt
-
-            if sph.rotation_speed:
-                sph.rotate(angle=sph.rotation_speed*self._dt)
+        self.__apply_impulses((self._time - self._start_time).total_seconds())
+
+        # controls.spheres can be reordered by a deletion (mouse callbacks run during rate()), so the rows of the
+        # arrays are matched to a copy of the list and written back to the same spheres.
+        spheres = list(self._spheres)
+        positions, velocities, masses, massive = self.__sphere_arrays(spheres)
+        if not self.__accelerations_current(spheres):
+            self._accelerations = accelerations(positions, masses, massive, self._gravity)
+
+        if self._collisions:
+            radii = np.array([sph.real_radius for sph in spheres], dtype=np.float64)
+        pairs = []
+        half_dt = 0.5*self._dt
+        taken = 0
+        while taken < steps:
+            velocities += self._accelerations*half_dt
+            positions += velocities*self._dt
+            self._accelerations = accelerations(positions, masses, massive, self._gravity)
+            velocities += self._accelerations*half_dt
+            taken += 1
+            # Collisions are checked every step, so spheres can't pass through each other between frames.
+            if self._collisions:
+                pairs = collision_pairs(positions, radii)
+                if pairs:
+                    break
+        self._acceleration_spheres = spheres
+
+        for sph, pos, vel in zip(spheres, positions, velocities):
+            if sph in self._controls.sphere_indices:
+                sph.pos = vector(*pos)
+                sph.vel = vector(*vel)
+
+        if pairs:
+            self.__check_collisions(spheres, pairs)
+
+        for sph in spheres:
+            if sph.rotation_speed and sph not in self._collided and sph in self._controls.sphere_indices:
+                sph.rotate(angle=sph.rotation_speed*self._dt*taken)
 
         if len(self._collided):
+            # The merged masses change the accelerations, so they are found again next step.
+            self._acceleration_spheres = None
             for sph in self._collided:
-                self._spheres.remove(sph)
+                self._controls.remove_sphere(sph)
+        return taken
 
     def __build_scenario(self):
         """ The scenario building phase of the simulation. """
@@ -161,12 +222,14 @@ class Simulate:
         self._scene.height = self._screen_height - self._controls.scene_height_sub
 
         if self._controls.start_time == 'now':
-            self._start_time = datetime.datetime.utcnow()
+            self._start_time = utc_now()
             self._start_time -= datetime.timedelta(microseconds=self._start_time.microsecond)
         else:
             self._start_time = self._controls.start_time
 
         self._time = self._start_time
+        self._accelerations = self._acceleration_spheres = None
+        self.__schedule_impulses()
         self._time_stamp = label(text=f'Datetime: {self._time} UTC', align='left', height=20, pixel_pos=True, box=False,
                                  pos=vector(20, self._scene.height-28, 0))
 
@@ -175,19 +238,24 @@ class Simulate:
             self._dt = self._controls.dt
             self._collisions = self._controls.collisions
 
+            # A frame never steps past the next impulse, so the impulse is applied at the start of a frame.
+            steps = max(1, int(abs(self._controls.time_rate_seconds/(self._dt*self._frame_rate))))
+            steps_to_impulse = self.__steps_to_impulse((self._time - self._start_time).total_seconds())
+            if steps_to_impulse is not None:
+                steps = min(steps, steps_to_impulse)
+
             # According to .../vpython/rate_control.py line 19:
             # Unresolved bug: rate(X) yields only about 0.8X iterations per second.
-            rate(self._controls.time_rate_seconds/(0.8*self._dt))
+            rate(self._controls.time_rate_seconds/(0.8*self._dt*steps))
 
             if self._scene.height != self._screen_height - self._controls.scene_height_sub:
                 self._scene.height = self._screen_height - self._controls.scene_height_sub
                 self._time_stamp.pos = vector(20, self._scene.height-28, 0)
 
-            if self._controls.labelled_sphere:
+            if self._controls.labelled_sphere is not None:
                 self._controls.labelled_sphere.label.pos = vector(20, self._scene.height-100, 0)
 
             if self._controls.running:
-                self._massives = [sph for sph in self._spheres if sph.massive]
-                self.__update_spheres()
-                self._time += datetime.timedelta(seconds=self._dt)
+                taken = self.__update_spheres(steps)
+                self._time += datetime.timedelta(seconds=self._dt*taken)
                 self._time_stamp.text = f'Datetime: {self._time} UTC'
@@ -67,6 +67,7 @@ class Sphere(simple_sphere, sphere, Elements, Maneuver):
         rotate: Rotates the Sphere about its axis.
         toggle_axes: Toggles on/off the cartesian axes of the sphere.
         delete: Deletes the Sphere and removes any lights, labels, axes, and trails associated with the Sphere as well.
+        from_arrays: Creates one Sphere for each position, velocity, mass, and name; all other values are shared.
     """
 
     _xaxis = vector(0, 0, 1)
@@ -159,7 +160,7 @@ class Sphere(simple_sphere, sphere, Elements, Maneuver):
             self.mass = self.preset.mass
             self.rotation_speed = self.preset.angular_rotation
             self.grav_parameter = self.preset.gravitational_parameter
-            self.name = str(self.preset())
+            self.name = self.preset.classname
             kwargs['radius'] = self.preset.radius
             kwargs['texture'] = self.preset.texture
             if isinstance(self.primary, Sphere):
@@ -381,6 +382,20 @@ class Sphere(simple_sphere, sphere, Elements, Maneuver):
             del self._ring
         self.__del__()
 
+    @classmethod
+    def from_arrays(cls, positions, velocities, masses, names, **shared):
+        """ Creates one Sphere for each position, velocity, mass, and name; all other values are shared.
+
+        :param positions: (list) The positions of the Spheres.
+        :param velocities: (list) The velocities of the Spheres.
+        :param masses: (list) The masses of the Spheres.
+        :param names: (list) The names of the Spheres.
+        :param shared: The Sphere parameters that are the same for every Sphere.
+        :return: (list) The created Spheres.
+        """
+
+        return [cls(pos=p, vel=v, mass=m, name=n, **shared) for p, v, m, n in zip(positions, velocities, masses, names)]
+
     @staticmethod
     def __try_vector(vect):
         try: